@@ -53,6 +53,7 @@ async def main() -> None:
         audit_repository=audit_repo,
         run_scope=config.run.scope,
         runsteps_repository=runsteps_repo,
+        log_lock_ttl=config.run.log_lock_ttl,
     )
 
     storage = MemoryStorage()
@@ -28,7 +28,7 @@ class AttachmentRepository:
         return items
 
     def _add_sync(self, record: AttachmentRecord) -> None:
-        current_rows = self._sheets.read("Attachments!A2:E")
+        current_rows = self._sheets.read("Attachments!A2:E", fresh=True)
         current_rows.append(record.to_row())
         rows = [ATTACHMENT_HEADERS]
         rows.extend(current_rows)
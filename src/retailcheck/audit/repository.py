@@ -16,7 +16,7 @@ class AuditRepository:
     # --- sync -----------------------------------------------------------
 
     def _append_sync(self, record: AuditRecord) -> None:
-        rows = self._sheets.read("Audit!A2:F")
+        rows = self._sheets.read("Audit!A2:F", fresh=True)
         rows.append(record.to_row())
         header = [["ts", "user_id", "action", "entity", "entity_id", "details"]]
         self._sheets.clear("Audit")
@@ -248,7 +248,7 @@ async def run_export(
     )
     record.period_start = target_date
     record.period_end = target_date
-    totals_preview = json.dumps(json.loads(record.totals_json), ensure_ascii=False)[:200]
+    totals_preview = json.dumps(record.totals, ensure_ascii=False)[:200]
     await message.answer(
         "Экспорт сформирован:\n"
         f"- магазин: {shop_id}\n"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from dataclasses import asdict
 from typing import Any, TypedDict
 
 from aiogram import Router
@@ -27,6 +28,8 @@ from retailcheck.users.repository import UsersRepository
 
 router = Router()
 USER_REQUIRED_TEXT = "Не удалось определить пользователя. Попробуйте снова."
+_BOOL_TRUE_TOKENS = frozenset({"1", "true", "да", "yes", "y", "ok", "👍"})
+_BOOL_FALSE_TOKENS = frozenset({"0", "false", "нет", "no", "n"})
 TERMINAL_CHOICES = {
     "tbank": "T-Bank",
     "t-bank": "T-Bank",
@@ -440,7 +443,7 @@ async def handle_step_input(
                 await message.answer("Не удалось сохранить шаг, попробуйте ещё раз.")
                 return
             if comment_required:
-                await state.update_data(pending_comment=record.__dict__)
+                await state.update_data(pending_comment=asdict(record))
                 await message.answer(
                     "Δ превышает порог. Пожалуйста, введите комментарий для объяснения расхождения."
                 )
@@ -714,9 +717,9 @@ def _parse_number_value(
 
 def _parse_bool_value(text: str) -> bool:
     normalized = text.strip().lower()
-    if normalized in {"1", "true", "да", "yes", "y", "ok", "👍"}:
+    if normalized in _BOOL_TRUE_TOKENS:
         return True
-    if normalized in {"0", "false", "нет", "no", "n"}:
+    if normalized in _BOOL_FALSE_TOKENS:
         return False
     raise ValueError("Ответьте 'да' или 'нет'.")
 
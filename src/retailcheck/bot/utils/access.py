@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from aiogram.types import User as TelegramUser
 from loguru import logger
 
@@ -37,11 +39,14 @@ async def ensure_user_allowed(
         return
     if getattr(user, "is_bot", False):
         return
-    shop = await find_shop(shops_repository, shop_id)
+    # Shops and Users are independent sheets; fetch them concurrently.
+    shop, record = await asyncio.gather(
+        find_shop(shops_repository, shop_id),
+        resolve_user_record(user, users_repository),
+    )
     if not shop:
         logger.warning("Shop {} not found while checking access for user {}", shop_id, user.id)
         raise ValueError(f"Shop {shop_id} not found")
-    record = await resolve_user_record(user, users_repository)
     if not record or not record.is_active:
         logger.warning(
             "User {} (@{}) not found or inactive in Users table; tg_id={}",
@@ -18,19 +18,10 @@ async def collect_shop_chat_ids(
     shop = await find_shop(shops_repository, shop_id)
     if not shop:
         return []
-    usernames = {
-        username.lower().lstrip("@")
-        for username in (shop.employee_usernames + shop.manager_usernames)
-        if username
-    }
-    chat_ids: list[int] = []
-    for username in usernames:
-        if not username:
-            continue
-        record = await users_repository.get_by_username(username)
-        if record and record.tg_id:
-            chat_ids.append(record.tg_id)
-    return chat_ids
+    usernames = {key for key in (*shop.employee_keys, *shop.manager_keys) if key}
+    # One lookup against a single Users snapshot instead of a worker per username.
+    records = await users_repository.get_by_usernames(usernames)
+    return [record.tg_id for record in records.values() if record.tg_id]
 
 
 async def broadcast_to_targets(
@@ -52,6 +52,7 @@ class RunSettings:
     lock_ttl_sec: int
     template_defaults: TemplateDefaults
     scope: str
+    log_lock_ttl: bool = False
 
 
 @dataclass(frozen=True)
@@ -92,6 +93,7 @@ def load_app_config() -> AppConfig:
     redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
     lock_ttl = int(os.getenv("REDIS_RUN_LOCK_TTL_SEC", "10"))
     run_scope = os.getenv("RUN_SCOPE", "shop_id_date")
+    log_lock_ttl = os.getenv("LOG_LEVEL", "INFO").upper() == "DEBUG"
     opening_template = os.getenv(
         "DEFAULT_TEMPLATE_OPEN_ID",
         os.getenv("DEFAULT_TEMPLATE_ID", "opening_v3"),
@@ -130,6 +132,7 @@ def load_app_config() -> AppConfig:
             lock_ttl_sec=lock_ttl,
             template_defaults=TemplateDefaults(phase_map=phase_map),
             scope=run_scope,
+            log_lock_ttl=log_lock_ttl,
         ),
         notifications=notifications,
         alerts=alerts,
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from uuid import uuid4
 
@@ -41,6 +41,12 @@ class ExportRecord:
     attachments_summary: str
     audit_link: str | None
     generated_at: str
+    # Parsed form of totals_json for in-process readers; not written to the sheet.
+    totals: dict[str, dict[str, str]] = field(default_factory=dict, compare=False)
+    # (role, step_code, kind, telegram_file_id) behind attachments_summary.
+    attachments_items: frozenset[tuple[str, str, str, str]] = field(
+        default_factory=frozenset, compare=False
+    )
 
     def to_row(self) -> list[str]:
         return [
@@ -82,6 +88,8 @@ class ExportRecord:
         delta_comment: str | None,
         audit_link: str | None = None,
     ) -> ExportRecord:
+        totals = _collect_totals(steps)
+        attachment_items = _collect_attachment_items(attachments, steps)
         return cls(
             export_id=str(uuid4()),
             period_start=run.date,
@@ -97,19 +105,21 @@ class ExportRecord:
             closer_user_id=run.closer_user_id,
             closer_username=run.closer_username,
             closer_at=run.closer_at,
-            totals_json=_serialize_totals(steps),
+            totals_json=json.dumps(totals, ensure_ascii=False, sort_keys=True),
             cash_total=cash_total,
             noncash_total=noncash_total,
             delta_total=f"{delta_total:.2f}",
             delta_comment=delta_comment,
             comment=run.comment,
-            attachments_summary=_format_attachments_summary(attachments, steps),
+            attachments_summary=_format_attachments_summary(attachment_items),
             audit_link=audit_link,
             generated_at=now_iso(),
+            totals=totals,
+            attachments_items=frozenset(attachment_items),
         )
 
 
-def _serialize_totals(steps: Sequence[RunStepRecord]) -> str:
+def _collect_totals(steps: Sequence[RunStepRecord]) -> dict[str, dict[str, str]]:
     totals: dict[str, dict[str, str]] = {}
     for step in steps:
         value = step.value_number or step.value_text or step.value_check
@@ -119,33 +129,37 @@ def _serialize_totals(steps: Sequence[RunStepRecord]) -> str:
         role_totals = totals.setdefault(role, {})
         role_totals[step.step_code] = str(value)
     # сортируем для стабильности
-    ordered = {
+    return {
         role: {code: role_totals[code] for code in sorted(role_totals)}
         for role, role_totals in sorted(totals.items())
     }
-    return json.dumps(ordered, ensure_ascii=False, sort_keys=True)
 
 
-def _format_attachments_summary(
+def _collect_attachment_items(
     attachments: Sequence[AttachmentRecord],
     steps: Sequence[RunStepRecord],
-) -> str:
+) -> list[tuple[str, str, str, str]]:
     if not attachments:
-        return ""
+        return []
     roles_by_step: dict[str, list[str]] = {}
     for step in steps:
         role = (step.owner_role or "shared").lower()
         roles_by_step.setdefault(step.step_code, []).append(role)
-    entries: list[str] = []
+    items: list[tuple[str, str, str, str]] = []
     for att in attachments:
-        descriptor = att.step_code
         kind_raw = (att.kind or "").strip()
         kind, role_hint = _split_kind_role(kind_raw)
-        if kind:
-            descriptor = f"{descriptor}:{kind}"
         owners = roles_by_step.get(att.step_code) or ["shared"]
         role_prefix = role_hint or (owners[0] if len(set(owners)) == 1 else "shared")
-        entries.append(f"{role_prefix}:{descriptor}={att.telegram_file_id}")
+        items.append((role_prefix, att.step_code, kind, att.telegram_file_id))
+    return items
+
+
+def _format_attachments_summary(items: Sequence[tuple[str, str, str, str]]) -> str:
+    entries: list[str] = []
+    for role, step_code, kind, file_id in items:
+        descriptor = f"{step_code}:{kind}" if kind else step_code
+        entries.append(f"{role}:{descriptor}={file_id}")
     entries.sort()
     return ", ".join(entries)
 
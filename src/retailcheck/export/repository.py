@@ -14,7 +14,7 @@ class ExportRepository:
         await asyncio.to_thread(self._append_sync, record)
 
     def _append_sync(self, record: ExportRecord) -> None:
-        rows = self._sheets.read("Export!A2:W")
+        rows = self._sheets.read("Export!A2:W", fresh=True)
         rows.append(record.to_row())
         header = [
             [
@@ -34,8 +34,17 @@ def _load_locale(locale: str = DEFAULT_LOCALE) -> dict[str, Any]:
 
 
 def gettext(key: str, **kwargs: Any) -> str:
-    data = _load_locale()
-    template: Any = data
+    template = _resolve(key)
+    try:
+        return template.format(**kwargs)
+    except Exception:
+        return template
+
+
+@lru_cache(maxsize=1024)
+def _resolve(key: str) -> str:
+    # Keys come from a fixed catalogue, so the dotted-path walk is done once per key.
+    template: Any = _load_locale()
     for part in key.split("."):
         if isinstance(template, dict):
             template = template.get(part)
@@ -44,7 +53,4 @@ def gettext(key: str, **kwargs: Any) -> str:
             break
     if template is None:
         template = key
-    try:
-        return str(template).format(**kwargs)
-    except Exception:
-        return str(template)
+    return str(template)
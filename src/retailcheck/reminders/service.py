@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from dataclasses import dataclass
 from datetime import date, datetime, time, timezone
@@ -156,24 +157,32 @@ class ReminderService:
         self._redis = redis
 
     async def run_mode(self, mode: str, shop_ids: list[str] | None = None) -> None:
-        shops = await self._shops_repo.list_active()
+        shops, user_index = await asyncio.gather(
+            self._shops_repo.list_active(),
+            self._build_user_index(),
+        )
         if shop_ids:
             target = {sid.lower() for sid in shop_ids}
             shops = [shop for shop in shops if shop.shop_id.lower() in target]
         if not shops:
             logger.info("No shops configured for mode %s", mode)
             return
+        utc_now = datetime.now(UTC)
         today = date.today().isoformat()
-        user_index = await self._build_user_index()
         for shop in shops:
             try:
                 run = await self._runs_repo.get_run(shop.shop_id, today)
-                await self._process_pending_steps(shop, run, user_index)
+                await self._process_pending_steps(shop, run, user_index, utc_now)
             except Exception as exc:  # noqa: BLE001
                 logger.exception("Reminder failed for shop %s: %s", shop.shop_id, exc)
 
     async def _process_shop(
-        self, mode: str, shop: ShopInfo, today: str, user_index: dict[str, int]
+        self,
+        mode: str,
+        shop: ShopInfo,
+        today: str,
+        user_index: dict[str, int],
+        utc_now: datetime,
     ) -> None:
         title = _format_title(mode, shop)
         run = await self._runs_repo.get_run(shop.shop_id, today)
@@ -183,7 +192,7 @@ class ReminderService:
                 return
         # New mode: pending_steps — reminds about incomplete steps by role
         if mode == "pending_steps":
-            await self._process_pending_steps(shop, run, user_index)
+            await self._process_pending_steps(shop, run, user_index, utc_now)
             return
         if mode.startswith("dual:"):
             slot = mode.split(":", 1)[1] if ":" in mode else ""
@@ -266,6 +275,7 @@ class ReminderService:
         shop: ShopInfo,
         run,
         user_index: dict[str, int],
+        utc_now: datetime,
     ) -> None:
         if not run:
             logger.debug("No run for shop %s, skipping reminders", shop.shop_id)
@@ -277,7 +287,7 @@ class ReminderService:
             await self._reset_reminder_state(run.run_id)
         steps = await self._runsteps_repo.list_for_run(run.run_id)
         tz = ZoneInfo(shop.timezone)
-        now_local = datetime.now(UTC).astimezone(tz)
+        now_local = utc_now.astimezone(tz)
         requirements = self._collect_required_steps(run)
         titles = {req.code: req.title for req in requirements}
         closer_day_started = any(
@@ -461,7 +471,6 @@ class ReminderService:
         state = await self._get_state(slot_id)
         if now_local < start_time:
             return False, state
-        last_local = state.last_sent.astimezone(now_local.tzinfo) if state.last_sent else None
         elapsed_min = (now_local - start_time).total_seconds() / 60
         use_after_interval = schedule.after_time and now_local.time() >= schedule.after_time
         if state.count < len(schedule.initial) and not use_after_interval:
@@ -476,6 +485,7 @@ class ReminderService:
         )
         if interval <= 0:
             return False, state
+        last_local = state.last_sent.astimezone(now_local.tzinfo) if state.last_sent else None
         minutes_since_last = _minutes_since(last_local, now_local)
         if minutes_since_last is None or minutes_since_last >= interval:
             new_count = max(state.count, len(schedule.initial)) + 1
@@ -727,22 +737,21 @@ class ReminderService:
         records = await self._users_repo.list_active()
         index: dict[str, int] = {}
         for record in records:
-            if record.username and record.tg_id:
-                index[record.username.lower().lstrip("@")] = record.tg_id
+            if record.username_key and record.tg_id:
+                index[record.username_key] = record.tg_id
         self._user_cache = index
         return index
 
     def _broadcast_ids(self, shop, user_index: dict[str, int]) -> list[int]:
-        usernames = shop.employee_usernames + shop.manager_usernames
-        return self._resolve_usernames(usernames, user_index)
+        keys = [*shop.employee_keys, *shop.manager_keys]
+        return self._resolve_usernames(keys, user_index)
 
-    def _resolve_usernames(self, usernames: list[str], user_index: dict[str, int]) -> list[int]:
+    def _resolve_usernames(self, keys: list[str], user_index: dict[str, int]) -> list[int]:
         ids: list[int] = []
-        for username in usernames:
-            key = username.lower().lstrip("@")
+        for key in keys:
             if key in user_index:
                 ids.append(user_index[key])
-        return list(dict.fromkeys(ids))
+        return _dedup(ids)
 
     def _resolve_run_user(
         self,
@@ -776,7 +785,7 @@ class ReminderService:
 
     async def _send_to_ids(self, chat_ids: list[int], text: str) -> bool:
         delivered = False
-        for chat_id in dict.fromkeys(chat_ids):
+        for chat_id in _dedup(chat_ids):
             try:
                 await self._bot.send_message(chat_id=chat_id, text=text)
                 delivered = True
@@ -793,15 +802,13 @@ class ReminderService:
             payload = json.loads(raw)
         except (TypeError, json.JSONDecodeError):
             return ReminderState()
-        last_sent = (
-            _parse_iso_datetime(payload.get("last_sent")) if isinstance(payload, dict) else None
-        )
-        count = 0
-        if isinstance(payload, dict):
-            try:
-                count = int(payload.get("count", 0) or 0)
-            except (TypeError, ValueError):
-                count = 0
+        if not isinstance(payload, dict):
+            return ReminderState()
+        last_sent = _parse_iso_datetime(payload.get("last_sent"))
+        try:
+            count = int(payload.get("count") or 0)
+        except (TypeError, ValueError):
+            count = 0
         return ReminderState(last_sent=last_sent, count=count)
 
     async def _should_send(self, slot_id: str) -> bool:
@@ -816,7 +823,7 @@ class ReminderService:
             "last_sent": payload_state.last_sent.isoformat() if payload_state.last_sent else "",
             "count": payload_state.count,
         }
-        await self._redis.setex(key, 3 * 24 * 3600, json.dumps(payload))
+        await self._redis.setex(key, 3 * 24 * 3600, json.dumps(payload, separators=(",", ":")))
 
     async def _reset_reminder_state(self, run_id: str) -> None:
         pattern = f"reminder_state:*:{run_id}"
@@ -835,6 +842,16 @@ def _format_title(mode: str, shop: ShopInfo) -> str:
     return f"Напоминание ({shop.name})"
 
 
+def _dedup(ids: list[int]) -> list[int]:
+    seen: set[int] = set()
+    unique: list[int] = []
+    for value in ids:
+        if value not in seen:
+            seen.add(value)
+            unique.append(value)
+    return unique
+
+
 def _pending_steps(steps: list[RunStepRecord], owner_roles: set[str]) -> list[str]:
     roles = {role.lower() for role in owner_roles}
     result = []
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 
 UTC = getattr(datetime, "UTC", timezone.utc)  # noqa: UP017 - keep fallback for older Python
 
@@ -27,13 +28,31 @@ RUN_HEADERS = [
     "created_at",
     "finished_at",
 ]
+_CURRENT_ACTIVE_IDX = RUN_HEADERS.index("current_active_user_id")
+# Columns whose position depends on the sheet generation; the first ten never move.
+_LAYOUT_COLUMNS = RUN_HEADERS[_CURRENT_ACTIVE_IDX:]
+
+
+def _build_layout(headers: list[str]) -> tuple[int | None, ...]:
+    return tuple(headers.index(name) if name in headers else None for name in _LAYOUT_COLUMNS)
+
+
+_LAYOUT_FULL = _build_layout(RUN_HEADERS)
+# Older sheets without current_active_user_id.
+_LAYOUT_NO_ACTIVE = _build_layout(
+    [name for name in RUN_HEADERS if name != "current_active_user_id"]
+)
+# Oldest sheets: neither current_active_user_id nor template_phase_map.
+_LAYOUT_NO_ACTIVE_NO_PHASE_MAP = _build_layout(
+    [name for name in RUN_HEADERS if name not in {"current_active_user_id", "template_phase_map"}]
+)
 
 
 def now_iso() -> str:
     return datetime.now(UTC).isoformat()
 
 
-@dataclass
+@dataclass(slots=True, repr=False, eq=False)
 class RunRecord:
     run_id: str
     date: str
@@ -67,12 +86,11 @@ class RunRecord:
         elif template := self.template_phase_map.get("close"):
             self.template_close_id = template
 
+    def __repr__(self) -> str:
+        return f"RunRecord({self.run_id!r}, {self.shop_id!r}, {self.date!r}, {self.status!r})"
+
     def to_row(self) -> list[str]:
-        phase_map_str = (
-            json.dumps(self.template_phase_map, ensure_ascii=False, separators=(",", ":"))
-            if self.template_phase_map
-            else ""
-        )
+        phase_map_str = _dump_phase_map_items(tuple(self.template_phase_map.items()))
         return [
             self.run_id,
             self.date,
@@ -98,79 +116,48 @@ class RunRecord:
     @classmethod
     def from_row(cls, row: list[str]) -> RunRecord:
         expected_len = len(RUN_HEADERS)
-        original_len = len(row)
-        if original_len >= expected_len:
-            padded = row + [""] * (expected_len - original_len)
-            current_active_idx = 10
-            template_open_idx = 11
-            template_close_idx = 12
-            phase_map_idx = 13
-            delta_idx = 14
-            comment_idx = 15
-            version_idx = 16
-            created_idx = 17
-            finished_idx = 18
-            phase_map_raw = padded[phase_map_idx]
-        elif original_len == expected_len - 1:
-            padded = row + [""]
+        if len(row) >= expected_len:
+            layout = _LAYOUT_FULL
+        elif len(row) == expected_len - 1:
             # Heuristic: if column 11 looks like a template id (e.g. opening_v1), then the
             # row comes from the older layout without current_active_user_id. Otherwise
             # we assume only finished_at is missing.
-            looks_like_template = padded[10] and not padded[10].isdigit()
-            if looks_like_template:
-                current_active_idx = None
-                template_open_idx = 10
-                template_close_idx = 11
-                phase_map_idx = 12
-                delta_idx = 13
-                comment_idx = 14
-                version_idx = 15
-                created_idx = 16
-                finished_idx = 17
-            else:
-                current_active_idx = 10
-                template_open_idx = 11
-                template_close_idx = 12
-                phase_map_idx = 13
-                delta_idx = 14
-                comment_idx = 15
-                version_idx = 16
-                created_idx = 17
-                finished_idx = 18
-            phase_map_raw = padded[phase_map_idx]
+            active_cell = row[_CURRENT_ACTIVE_IDX]
+            looks_like_template = active_cell and not active_cell.isdigit()
+            layout = _LAYOUT_NO_ACTIVE if looks_like_template else _LAYOUT_FULL
         else:
-            padded = row + [""] * ((expected_len - 2) - original_len)
-            current_active_idx = None
-            template_open_idx = 10
-            template_close_idx = 11
-            phase_map_raw = ""
-            delta_idx = 12
-            comment_idx = 13
-            version_idx = 14
-            created_idx = 15
-            finished_idx = 16
+            layout = _LAYOUT_NO_ACTIVE_NO_PHASE_MAP
+        (
+            current_active,
+            template_open,
+            template_close,
+            phase_map_raw,
+            delta,
+            comment,
+            version,
+            created,
+            finished,
+        ) = (_cell(row, idx) if idx is not None else "" for idx in layout)
         return cls(
-            run_id=padded[0],
-            date=padded[1],
-            shop_id=padded[2],
-            status=padded[3] or "opened",
-            opener_user_id=padded[4] or None,
-            opener_username=padded[5] or None,
-            opener_at=padded[6] or None,
-            closer_user_id=padded[7] or None,
-            closer_username=padded[8] or None,
-            closer_at=padded[9] or None,
-            current_active_user_id=(
-                (padded[current_active_idx] or None) if current_active_idx is not None else None
-            ),
-            template_open_id=padded[template_open_idx] or "",
-            template_close_id=padded[template_close_idx] or "",
+            run_id=_cell(row, 0),
+            date=_cell(row, 1),
+            shop_id=_cell(row, 2),
+            status=_cell(row, 3) or "opened",
+            opener_user_id=_cell(row, 4) or None,
+            opener_username=_cell(row, 5) or None,
+            opener_at=_cell(row, 6) or None,
+            closer_user_id=_cell(row, 7) or None,
+            closer_username=_cell(row, 8) or None,
+            closer_at=_cell(row, 9) or None,
+            current_active_user_id=current_active or None,
+            template_open_id=template_open,
+            template_close_id=template_close,
             template_phase_map=_parse_phase_map(phase_map_raw),
-            delta_rub=padded[delta_idx] or None,
-            comment=padded[comment_idx] or None,
-            version=int(padded[version_idx] or "1"),
-            created_at=padded[created_idx] or now_iso(),
-            finished_at=padded[finished_idx] or None,
+            delta_rub=delta or None,
+            comment=comment or None,
+            version=int(version or "1"),
+            created_at=created or now_iso(),
+            finished_at=finished or None,
         )
 
     def with_opener(
@@ -179,10 +166,11 @@ class RunRecord:
         username: str | None,
         *,
         preserve_status: bool = False,
+        now: str | None = None,
     ) -> RunRecord:
         self.opener_user_id = user_id
         self.opener_username = username
-        self.opener_at = now_iso()
+        self.opener_at = now or now_iso()
         if not preserve_status and self.status != "closed":
             self.status = "in_progress"
         return self
@@ -193,10 +181,11 @@ class RunRecord:
         username: str | None,
         *,
         preserve_status: bool = False,
+        now: str | None = None,
     ) -> RunRecord:
         self.closer_user_id = user_id
         self.closer_username = username
-        self.closer_at = now_iso()
+        self.closer_at = now or now_iso()
         if not preserve_status and self.status != "closed":
             self.status = "in_progress"
         return self
@@ -216,17 +205,34 @@ class RunRecord:
         return ""
 
 
+def _cell(row: list[str], idx: int) -> str:
+    return row[idx] if idx < len(row) else ""
+
+
+@lru_cache(maxsize=256)
+def _dump_phase_map_items(items: tuple[tuple[str, str], ...]) -> str:
+    if not items:
+        return ""
+    return json.dumps(dict(items), ensure_ascii=False, separators=(",", ":"))
+
+
 def _parse_phase_map(raw: str) -> dict[str, str]:
+    # Callers mutate the map, so hand out a fresh dict built from the cached parse.
+    return dict(_parse_phase_map_items(raw))
+
+
+@lru_cache(maxsize=256)
+def _parse_phase_map_items(raw: str) -> tuple[tuple[str, str], ...]:
     if not raw:
-        return {}
+        return ()
     try:
         parsed = json.loads(raw)
     except json.JSONDecodeError:
-        return {}
+        return ()
     if not isinstance(parsed, dict):
-        return {}
-    cleaned: dict[str, str] = {}
-    for key, value in parsed.items():
-        if isinstance(key, str) and isinstance(value, str) and value:
-            cleaned[key] = value
-    return cleaned
+        return ()
+    return tuple(
+        (key, value)
+        for key, value in parsed.items()
+        if isinstance(key, str) and isinstance(value, str) and value
+    )
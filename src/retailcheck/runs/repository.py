@@ -1,19 +1,33 @@
 from __future__ import annotations
 
 import asyncio
+import threading
+import time
 
 from retailcheck.runs.models import RUN_HEADERS, RunRecord
 from retailcheck.sheets.client import SheetsClient
 
+RUNS_CACHE_TTL_SEC = 5.0
+
 
 class RunsRepository:
     """Simple Sheets-backed repository for Runs sheet."""
 
-    def __init__(self, sheets: SheetsClient) -> None:
+    def __init__(self, sheets: SheetsClient, cache_ttl: float = RUNS_CACHE_TTL_SEC) -> None:
         self._sheets = sheets
+        self._cache_ttl = cache_ttl
+        # Raw rows are cached (not records) so callers can mutate what they get back.
+        self._rows_cache: tuple[float, list[list[str]]] | None = None
+        # Bumped by every save; a read that overlapped a save must not refill the cache.
+        self._generation = 0
+        self._cache_lock = threading.Lock()
+
+    async def get_run(self, shop_id: str, date: str, *, fresh: bool = False) -> RunRecord | None:
+        """Pass `fresh=True` when the record will be modified and saved back."""
+        return await asyncio.to_thread(self._get_run_sync, shop_id, date, fresh)
 
-    async def get_run(self, shop_id: str, date: str) -> RunRecord | None:
-        return await asyncio.to_thread(self._get_run_sync, shop_id, date)
+    async def get_by_run_id(self, run_id: str, *, fresh: bool = False) -> RunRecord | None:
+        return await asyncio.to_thread(self._get_by_run_id_sync, run_id, fresh)
 
     async def save_run(self, record: RunRecord) -> None:
         await asyncio.to_thread(self._save_run_sync, record)
@@ -23,39 +37,57 @@ class RunsRepository:
 
     # --- sync helpers -----------------------------------------------------
 
+    def _read_rows(self, *, fresh: bool = False) -> list[list[str]]:
+        cached = self._rows_cache
+        if not fresh and cached and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+        generation = self._generation
+        # This cache has its own TTL; bypass the client's so the two don't stack.
+        rows = self._sheets.read("Runs!A2:S", fresh=True)
+        with self._cache_lock:
+            if self._generation == generation:
+                self._rows_cache = (time.monotonic(), rows)
+        return rows
+
     def _list_runs_sync(self) -> list[RunRecord]:
-        values = self._sheets.read("Runs!A2:S")
-        records = []
-        for row in values:
-            if not row or not any(row):
-                continue
-            records.append(RunRecord.from_row(row))
-        return records
-
-    def _get_run_sync(self, shop_id: str, date: str) -> RunRecord | None:
-        for record in self._list_runs_sync():
-            if record.shop_id == shop_id and record.date == date:
-                return record
+        return [RunRecord.from_row(row) for row in self._read_rows() if row and any(row)]
+
+    def _get_run_sync(self, shop_id: str, date: str, fresh: bool = False) -> RunRecord | None:
+        for row in self._read_rows(fresh=fresh):
+            # date and shop_id sit in the same columns for every Runs layout.
+            if len(row) > 2 and row[1] == date and row[2] == shop_id:
+                return RunRecord.from_row(row)
+        return None
+
+    def _get_by_run_id_sync(self, run_id: str, fresh: bool = False) -> RunRecord | None:
+        for row in self._read_rows(fresh=fresh):
+            if row and row[0] == run_id:
+                return RunRecord.from_row(row)
         return None
 
     def _save_run_sync(self, record: RunRecord) -> None:
         # WARNING: This method uses read-modify-write pattern without locking.
-        # Concurrent updates to different records may cause data loss.
+        # Concurrent inserts may pick the same free row and overwrite each other.
         # For production, consider adding Redis locks or using optimistic locking
         # with version field.
-        records = self._list_runs_sync()
-        updated = False
-        for idx, existing in enumerate(records):
-            if existing.run_id == record.run_id:
-                records[idx] = record
-                updated = True
-                break
-        if not updated:
-            records.append(record)
-        self._write_all(records)
-
-    def _write_all(self, records: list[RunRecord]) -> None:
-        rows = [RUN_HEADERS]
-        rows.extend(record.to_row() for record in records)
-        self._sheets.clear("Runs")
-        self._sheets.write("Runs!A1", rows)
+        # Always re-read here: a cached snapshot would widen the lost-update window.
+        generation = self._generation
+        rows = list(self._sheets.read("Runs!A2:S", fresh=True))
+        row_idx = next(
+            (idx for idx, row in enumerate(rows) if row and row[0] == record.run_id),
+            len(rows),
+        )
+        new_row = record.to_row()
+        if rows:
+            self._sheets.write(f"Runs!A{row_idx + 2}", [new_row])
+        else:
+            self._sheets.write("Runs!A1", [RUN_HEADERS, new_row])
+        if row_idx < len(rows):
+            rows[row_idx] = new_row
+        else:
+            rows.append(new_row)
+        with self._cache_lock:
+            # Another save in between means our snapshot misses its row; just drop it.
+            fresh_rows = self._generation == generation
+            self._generation += 1
+            self._rows_cache = (time.monotonic(), rows) if fresh_rows else None
@@ -30,14 +30,14 @@ class RoleAlreadyTakenError(Exception):
         self.username = username
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunUser:
     user_id: int
     username: str | None
     full_name: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RoleAssignmentResult:
     run: RunRecord
     role: str
@@ -54,25 +54,28 @@ class RunService:
         audit_repository: AuditRepository | None = None,
         run_scope: str = "shop_id_date",
         runsteps_repository: RunStepsRepository | None = None,
+        log_lock_ttl: bool = False,
     ) -> None:
         self._repository = repository
         self._redis = redis
         self._templates = template_defaults
+        self._template_phase_keys = frozenset(template_defaults.phase_map)
         self._lock_ttl = lock_ttl
         self._audit_repo = audit_repository
         self._run_scope = run_scope
         self._runsteps_repo = runsteps_repository
+        self._log_lock_ttl = log_lock_ttl
 
     async def assign_role(self, shop_id: str, role: str, user: RunUser) -> RoleAssignmentResult:
         if role not in ("open", "close"):
             raise ValueError(f"Unknown role: {role}")
 
-        today = date.today().isoformat()
+        today = self._today()
         lock_key = self._build_lock_key(shop_id, today, role)
         lock = self._redis.lock(lock_key, timeout=self._lock_ttl)
         async with lock:
             await self._log_lock_acquired(lock)
-            run = await self._repository.get_run(shop_id, today)
+            run = await self._repository.get_run(shop_id, today, fresh=True)
             if role == "open":
                 result = await self._assign_opener(run, shop_id, today, user)
             else:
@@ -82,6 +85,7 @@ class RunService:
     async def _assign_opener(
         self, run: RunRecord | None, shop_id: str, today: str, user: RunUser
     ) -> RoleAssignmentResult:
+        now = now_iso()
         if run is None:
             phase_map = self._new_phase_map()
             run = RunRecord(
@@ -92,24 +96,26 @@ class RunService:
                 template_open_id=self._templates.opening_template_id,
                 template_close_id=self._templates.closing_template_id,
                 template_phase_map=phase_map,
+                created_at=now,
             )
-            run.created_at = now_iso()
-            run.with_opener(str(user.user_id), user.username)
+            run.with_opener(str(user.user_id), user.username, now=now)
             self._set_active_user(run, user)
             await self._repository.save_run(run)
             await self._log_role_assignment("start_open", run, user)
             return RoleAssignmentResult(run=run, role="open", state="assigned")
 
-        self._ensure_phase_map(run)
+        phase_map_changed = self._ensure_phase_map(run)
         if run.opener_user_id == str(user.user_id):
-            self._set_active_user(run, user)
-            await self._repository.save_run(run)
+            # Repeated taps by the holder usually change nothing; skip the Sheets write then.
+            if phase_map_changed or run.current_active_user_id != str(user.user_id):
+                self._set_active_user(run, user)
+                await self._repository.save_run(run)
             return RoleAssignmentResult(run=run, role="open", state="already_holder")
 
         if run.opener_user_id:
             raise RoleAlreadyTakenError("open", run.opener_username)
 
-        run.with_opener(str(user.user_id), user.username)
+        run.with_opener(str(user.user_id), user.username, now=now)
         self._set_active_user(run, user)
         await self._repository.save_run(run)
         await self._log_role_assignment("start_open", run, user)
@@ -121,10 +127,12 @@ class RunService:
         if run is None:
             raise RunNotFoundError(f"No run for shop {shop_id} at {today}")
 
-        self._ensure_phase_map(run)
+        phase_map_changed = self._ensure_phase_map(run)
         if run.closer_user_id == str(user.user_id):
-            self._set_active_user(run, user)
-            await self._repository.save_run(run)
+            # Repeated taps by the holder usually change nothing; skip the Sheets write then.
+            if phase_map_changed or run.current_active_user_id != str(user.user_id):
+                self._set_active_user(run, user)
+                await self._repository.save_run(run)
             return RoleAssignmentResult(run=run, role="close", state="already_holder")
 
         if run.closer_user_id:
@@ -137,7 +145,7 @@ class RunService:
         return RoleAssignmentResult(run=run, role="close", state="assigned")
 
     async def get_today_run(self, shop_id: str) -> RunRecord | None:
-        today = date.today().isoformat()
+        today = self._today()
         return await self._repository.get_run(shop_id, today)
 
     async def finalize_run(self, run_id: str, delta_total: float) -> RunRecord:
@@ -146,8 +154,7 @@ class RunService:
         lock = self._redis.lock(lock_key, timeout=self._lock_ttl)
         async with lock:
             await self._log_lock_acquired(lock)
-            runs = await self._repository.list_runs()
-            run = next((r for r in runs if r.run_id == run_id), None)
+            run = await self._repository.get_by_run_id(run_id, fresh=True)
             if not run:
                 raise RunNotFoundError(run_id)
             # Prevent finalizing already closed runs
@@ -165,30 +172,31 @@ class RunService:
     async def handover_role(self, shop_id: str, role: str, user: RunUser) -> RunRecord:
         if role not in ("open", "close"):
             raise ValueError(f"Unknown role: {role}")
-        today = date.today().isoformat()
+        today = self._today()
         lock_key = self._build_lock_key(shop_id, today, role)
         lock = self._redis.lock(lock_key, timeout=self._lock_ttl)
         async with lock:
             await self._log_lock_acquired(lock)
-            run = await self._repository.get_run(shop_id, today)
+            run = await self._repository.get_run(shop_id, today, fresh=True)
             if not run:
                 raise RunNotFoundError(f"No run for shop {shop_id} at {today}")
             self._ensure_phase_map(run)
+            now = now_iso()
             if role == "open":
-                run.with_opener(str(user.user_id), user.username, preserve_status=True)
+                run.with_opener(str(user.user_id), user.username, preserve_status=True, now=now)
             else:
-                run.with_closer(str(user.user_id), user.username, preserve_status=True)
+                run.with_closer(str(user.user_id), user.username, preserve_status=True, now=now)
             self._set_active_user(run, user)
             await self._repository.save_run(run)
             return run
 
     async def create_run(self, shop_id: str, run_date: str | None = None) -> RunRecord:
-        target_date = run_date or date.today().isoformat()
+        target_date = run_date or self._today()
         lock_key = self._build_lock_key(shop_id, target_date, "create")
         lock = self._redis.lock(lock_key, timeout=self._lock_ttl)
         async with lock:
             await self._log_lock_acquired(lock)
-            existing = await self._repository.get_run(shop_id, target_date)
+            existing = await self._repository.get_run(shop_id, target_date, fresh=True)
             if existing:
                 raise RunAlreadyExistsError(f"Run already exists for {shop_id} on {target_date}")
             phase_map = self._new_phase_map()
@@ -211,8 +219,8 @@ class RunService:
         reason: str,
         run_date: str | None = None,
     ) -> RunRecord:
-        target_date = run_date or date.today().isoformat()
-        run = await self._repository.get_run(shop_id, target_date)
+        target_date = run_date or self._today()
+        run = await self._repository.get_run(shop_id, target_date, fresh=True)
         if not run:
             raise RunNotFoundError(f"No run for shop {shop_id} at {target_date}")
         self._ensure_phase_map(run)
@@ -238,8 +246,7 @@ class RunService:
         lock = self._redis.lock(lock_key, timeout=self._lock_ttl)
         async with lock:
             await self._log_lock_acquired(lock)
-            runs = await self._repository.list_runs()
-            run = next((r for r in runs if r.run_id == run_id), None)
+            run = await self._repository.get_by_run_id(run_id, fresh=True)
             if not run:
                 raise RunNotFoundError(run_id)
             self._ensure_phase_map(run)
@@ -257,10 +264,17 @@ class RunService:
         )
         if isinstance(redis_key, bytes):
             redis_key = redis_key.decode()
+        if not self._log_lock_ttl:
+            # PTTL costs a Redis round-trip, so only query it for debug logging.
+            logger.info("Lock %s acquired", redis_key or "unknown")
+            return
         ttl_target = lock_name or redis_key
         ttl_ms = await self._redis.pttl(ttl_target) if ttl_target else -1
         ttl_sec = ttl_ms / 1000 if ttl_ms and ttl_ms > 0 else -1
-        logger.info("Lock %s acquired (ttl %.1fs)", redis_key or "unknown", ttl_sec)
+        logger.debug("Lock %s acquired (ttl %.1fs)", redis_key or "unknown", ttl_sec)
+
+    def _today(self) -> str:
+        return date.today().isoformat()
 
     def _build_lock_key(self, shop_id: str, date_value: str, suffix: str) -> str:
         if self._run_scope == "shop_id_only":
@@ -270,7 +284,15 @@ class RunService:
     def _new_phase_map(self) -> dict[str, str]:
         return dict(self._templates.phase_map)
 
-    def _ensure_phase_map(self, run: RunRecord) -> None:
+    def _ensure_phase_map(self, run: RunRecord) -> bool:
+        """Fill missing phase templates; return False when the run was already complete."""
+        phase_map = run.template_phase_map
+        if (
+            phase_map.keys() >= self._template_phase_keys
+            and run.template_open_id == phase_map.get("open", self._templates.opening_template_id)
+            and run.template_close_id == phase_map.get("close", self._templates.closing_template_id)
+        ):
+            return False
         if not run.template_phase_map:
             run.template_phase_map = self._new_phase_map()
         for phase, template_id in self._templates.phase_map.items():
@@ -283,6 +305,7 @@ class RunService:
             "close",
             self._templates.closing_template_id,
         )
+        return True
 
     def _set_active_user(self, run: RunRecord, user: RunUser) -> None:
         run.current_active_user_id = str(user.user_id)
@@ -316,7 +339,7 @@ class RunService:
     async def _mark_steps_as_error(self, run: RunRecord) -> None:
         if not self._runsteps_repo:
             return
-        steps = await self._runsteps_repo.list_for_run(run.run_id)
+        steps = await self._runsteps_repo.list_for_run(run.run_id, fresh=True)
         to_update = []
         now = now_iso()
         for step in steps:
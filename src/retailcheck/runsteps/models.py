@@ -21,13 +21,16 @@ RUN_STEP_HEADERS = [
     "updated_at",
     "idempotency_key",
 ]
+_STARTED_IDX = RUN_STEP_HEADERS.index("started_at")
+_UPDATED_IDX = RUN_STEP_HEADERS.index("updated_at")
+_IDEMPOTENCY_IDX = RUN_STEP_HEADERS.index("idempotency_key")
 
 
 def now_iso() -> str:
     return datetime.now(UTC).isoformat()
 
 
-@dataclass
+@dataclass(slots=True, repr=False, eq=False)
 class RunStepRecord:
     run_id: str
     phase: str
@@ -44,6 +47,12 @@ class RunStepRecord:
     updated_at: str = now_iso()
     idempotency_key: str | None = None
 
+    def __repr__(self) -> str:
+        return (
+            f"RunStepRecord({self.run_id!r}, {self.phase!r}, {self.step_code!r}, "
+            f"{self.owner_role!r}, {self.status!r})"
+        )
+
     def to_row(self) -> list[str]:
         return [
             self.run_id,
@@ -64,23 +73,23 @@ class RunStepRecord:
 
     @classmethod
     def from_row(cls, row: list[str]) -> RunStepRecord:
-        padded = row + [""] * (len(RUN_STEP_HEADERS) - len(row))
-        started_idx = RUN_STEP_HEADERS.index("started_at")
-        updated_idx = RUN_STEP_HEADERS.index("updated_at")
-        idempotency_idx = RUN_STEP_HEADERS.index("idempotency_key")
         return cls(
-            run_id=padded[0],
-            phase=padded[1],
-            step_code=padded[2],
-            owner_role=padded[3] or "shared",
-            value_number=padded[4] or None,
-            value_text=padded[5] or None,
-            value_check=padded[6] or None,
-            delta_number=padded[7] or None,
-            comment=padded[8] or None,
-            performer_user_id=padded[9] or None,
-            status=padded[10] or "pending",
-            started_at=padded[started_idx] or now_iso(),
-            updated_at=padded[updated_idx] or now_iso(),
-            idempotency_key=padded[idempotency_idx] or None,
+            run_id=_cell(row, 0),
+            phase=_cell(row, 1),
+            step_code=_cell(row, 2),
+            owner_role=_cell(row, 3) or "shared",
+            value_number=_cell(row, 4) or None,
+            value_text=_cell(row, 5) or None,
+            value_check=_cell(row, 6) or None,
+            delta_number=_cell(row, 7) or None,
+            comment=_cell(row, 8) or None,
+            performer_user_id=_cell(row, 9) or None,
+            status=_cell(row, 10) or "pending",
+            started_at=_cell(row, _STARTED_IDX) or now_iso(),
+            updated_at=_cell(row, _UPDATED_IDX) or now_iso(),
+            idempotency_key=_cell(row, _IDEMPOTENCY_IDX) or None,
         )
+
+
+def _cell(row: list[str], idx: int) -> str:
+    return row[idx] if idx < len(row) else ""
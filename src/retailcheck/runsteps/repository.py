@@ -1,58 +1,112 @@
 from __future__ import annotations
 
 import asyncio
+import threading
+import time
+from collections.abc import Iterable
 
 from retailcheck.runsteps.models import RUN_STEP_HEADERS, RunStepRecord
 from retailcheck.sheets.client import SheetsClient
 
+RUN_STEPS_CACHE_TTL_SEC = 5.0
+
 
 class RunStepsRepository:
     """Store RunSteps sheet in Google Sheets."""
 
-    def __init__(self, sheets: SheetsClient) -> None:
+    def __init__(self, sheets: SheetsClient, cache_ttl: float = RUN_STEPS_CACHE_TTL_SEC) -> None:
         self._sheets = sheets
+        self._cache_ttl = cache_ttl
+        # Raw rows grouped by run_id from a single sheet read; records are built per call.
+        self._by_run_id: tuple[float, dict[str, list[list[str]]]] | None = None
+        # Bumped by every upsert; a read that overlapped one must not refill the cache.
+        self._generation = 0
+        self._cache_lock = threading.Lock()
+
+    async def list_for_run(self, run_id: str, *, fresh: bool = False) -> list[RunStepRecord]:
+        """Pass `fresh=True` when the steps will be modified and upserted back."""
+        return await asyncio.to_thread(self._list_sync, run_id, fresh)
 
-    async def list_for_run(self, run_id: str) -> list[RunStepRecord]:
-        return await asyncio.to_thread(self._list_sync, run_id)
+    async def list_for_runs(self, run_ids: Iterable[str]) -> dict[str, list[RunStepRecord]]:
+        """Steps for several runs from one sheet snapshot; runs without steps map to []."""
+        return await asyncio.to_thread(self._list_many_sync, list(run_ids))
 
     async def upsert(self, records: list[RunStepRecord]) -> None:
         await asyncio.to_thread(self._upsert_sync, records)
 
     # ---- sync helpers --------------------------------------------------
 
-    def _list_sync(self, run_id: str) -> list[RunStepRecord]:
-        values = self._sheets.read("RunSteps!A2:N")
-        result = []
-        for row in values:
+    def _list_sync(self, run_id: str, fresh: bool = False) -> list[RunStepRecord]:
+        rows = self._rows_by_run_id(fresh=fresh).get(run_id, [])
+        return [RunStepRecord.from_row(row) for row in rows]
+
+    def _list_many_sync(self, run_ids: list[str]) -> dict[str, list[RunStepRecord]]:
+        grouped = self._rows_by_run_id()
+        return {
+            run_id: [RunStepRecord.from_row(row) for row in grouped.get(run_id, [])]
+            for run_id in run_ids
+        }
+
+    def _rows_by_run_id(self, *, fresh: bool = False) -> dict[str, list[list[str]]]:
+        cached = self._by_run_id
+        if not fresh and cached and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+        generation = self._generation
+        grouped: dict[str, list[list[str]]] = {}
+        # This cache has its own TTL; bypass the client's so the two don't stack.
+        for row in self._sheets.read("RunSteps!A2:N", fresh=True):
             if not row or not row[0]:
                 continue
-            if row[0] == run_id:
-                result.append(RunStepRecord.from_row(row))
-        return result
+            grouped.setdefault(row[0], []).append(row)
+        with self._cache_lock:
+            if self._generation == generation:
+                self._by_run_id = (time.monotonic(), grouped)
+        return grouped
 
     def _upsert_sync(self, records: list[RunStepRecord]) -> None:
         # WARNING: This method uses read-modify-write pattern without locking.
-        # Concurrent updates to different records may cause data loss.
+        # Concurrent inserts may pick the same free row and overwrite each other.
         # For production, consider adding Redis locks or using optimistic locking.
-        current_rows = self._sheets.read("RunSteps!A2:N")
-        existing: dict[tuple[str, str, str, str], RunStepRecord] = {}
-        for row in current_rows:
+        current_rows = self._sheets.read("RunSteps!A2:N", fresh=True)
+        positions: dict[tuple[str, str, str, str], int] = {}
+        for idx, row in enumerate(current_rows):
             if not row or not row[0]:
                 continue
-            record = RunStepRecord.from_row(row)
-            # Normalize owner_role to prevent None from causing key mismatches
-            owner_role = (record.owner_role or "shared").lower()
-            existing[(record.run_id, record.phase, record.step_code, owner_role)] = record
+            # Key straight from the raw cells; untouched rows are never parsed.
+            padded = row[:4] + [""] * (4 - len(row))
+            owner_role = (padded[3] or "shared").lower()
+            positions[(padded[0], padded[1], padded[2], owner_role)] = idx
 
+        updates: dict[int, list[str]] = {}
+        # New rows keep their arrival order and go out as one contiguous range.
+        appended: list[list[str]] = []
+        base = len(current_rows)
         for record in records:
             # Normalize owner_role consistently
             owner_role = (record.owner_role or "shared").lower()
             key = (record.run_id, record.phase, record.step_code, owner_role)
-            existing[key] = record
-
-        rows = [RUN_STEP_HEADERS]
-        for record in existing.values():
-            rows.append(record.to_row())
+            pos = positions.get(key)
+            if pos is None:
+                positions[key] = base + len(appended)
+                appended.append(record.to_row())
+            elif pos >= base:
+                appended[pos - base] = record.to_row()
+            else:
+                updates[pos] = record.to_row()
+        if not updates and not appended:
+            return
 
-        self._sheets.clear("RunSteps")
-        self._sheets.write("RunSteps!A1", rows)
+        data = [
+            {"range": f"RunSteps!A{idx + 2}", "values": [row]}
+            for idx, row in sorted(updates.items())
+        ]
+        if not current_rows:
+            data.append({"range": "RunSteps!A1", "values": [RUN_STEP_HEADERS, *appended]})
+        elif appended:
+            data.append({"range": f"RunSteps!A{base + 2}", "values": appended})
+        try:
+            self._sheets.batch_update(data)
+        finally:
+            with self._cache_lock:
+                self._generation += 1
+                self._by_run_id = None
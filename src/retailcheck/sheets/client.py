@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import random
 import socket
+import threading
 import time
-from collections import Counter
 from collections.abc import Callable, Sequence
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -11,14 +13,20 @@ from loguru import logger
 
 CredentialsClass: type[Any] | None
 BuildCallable: Callable[..., Any] | None
+AuthorizedHttpClass: type[Any] | None
+HttpClass: type[Any] | None
 HttpError: type[Exception]
 try:
+    import httplib2
     from google.oauth2.service_account import Credentials as _Credentials
+    from google_auth_httplib2 import AuthorizedHttp as _AuthorizedHttp
     from googleapiclient.discovery import build as _build
     from googleapiclient.errors import HttpError as _HttpError
 except ModuleNotFoundError:  # pragma: no cover - allows running tests without Google libs
     CredentialsClass = None
     BuildCallable = None
+    AuthorizedHttpClass = None
+    HttpClass = None
 
     class _FallbackHttpError(Exception):
         """Fallback HttpError when googleapiclient isn't installed."""
@@ -27,13 +35,23 @@ except ModuleNotFoundError:  # pragma: no cover - allows running tests without G
 else:  # pragma: no branch
     CredentialsClass = _Credentials
     BuildCallable = _build
+    AuthorizedHttpClass = _AuthorizedHttp
+    HttpClass = httplib2.Http
     HttpError = _HttpError
 
 
 DEFAULT_TIMEOUT = 30
+DEFAULT_READ_TTL = 30.0
 MAX_RETRIES = 3
+BACKOFF_BASE_SEC = 1.0
+RETRYABLE_HTTP_STATUSES = frozenset({429, 500, 502, 503, 504})
+ERROR_KINDS = ("http_error", "io_error", "unexpected_error")
 
 
+# httplib2.Http is not thread-safe, so each worker thread keeps its own authorized
+# connection per credentials object and reuses it across calls and clients.
+_THREAD_HTTP = threading.local()
+
 RETRYABLE_IO_ERRORS = (
     BrokenPipeError,
     TimeoutError,
@@ -52,38 +70,83 @@ class SheetsClient:
         *,
         service: Any | None = None,
         error_notifier: Callable[[str, Exception], None] | None = None,
+        read_ttl: float = DEFAULT_READ_TTL,
     ) -> None:
         self.spreadsheet_id = spreadsheet_id
+        self._read_ttl = read_ttl
+        self._read_cache: dict[str, tuple[float, list[list[str]]]] = {}
+        # Bumped on every invalidation, so a read that overlapped a write isn't cached.
+        self._generations: dict[str, int] = {}
+        self._epoch = 0
+        # Worker threads share the cache; the generation check and the store must be atomic.
+        self._cache_lock = threading.Lock()
         self._error_notifier = error_notifier
-        self._error_counts: Counter[str] = Counter()
-        if service is not None:
-            self._service = service
-            return
-        if CredentialsClass is None or BuildCallable is None:
-            raise ImportError(
-                "Google Sheets client requires `google-api-python-client` and "
-                "`google-auth` packages. Install project dependencies to use SheetsClient."
+        self._error_counts: dict[str, int] = dict.fromkeys(ERROR_KINDS, 0)
+        self._credentials: Any | None = None
+        if service is None:
+            if CredentialsClass is None or BuildCallable is None:
+                raise ImportError(
+                    "Google Sheets client requires `google-api-python-client` and "
+                    "`google-auth` packages. Install project dependencies to use SheetsClient."
+                )
+            self._credentials, service = _build_service(str(service_account_file))
+        self._service: Any = service
+        # Resolve the values() resource once instead of on every request.
+        self._values: Any = service.spreadsheets().values()
+
+    def read(self, sheet_range: str, *, fresh: bool = False) -> list[list[str]]:
+        """
+        Read a range, serving repeats from a short in-process cache.
+
+        Pass `fresh=True` for read-modify-write paths that must see the latest sheet.
+        """
+        if not fresh:
+            cached = self._cached_values(sheet_range)
+            if cached is not None:
+                return cached
+        generation = self._generation(sheet_range)
+        response = self._execute_with_retry(
+            lambda: self._values.get(
+                spreadsheetId=self.spreadsheet_id, range=sheet_range, fields="values"
             )
-        scopes = ["https://www.googleapis.com/auth/spreadsheets"]
-        creds = CredentialsClass.from_service_account_file(  # type: ignore[union-attr]
-            str(service_account_file),
-            scopes=scopes,
-        )
-        self._service: Any = BuildCallable(  # type: ignore[operator]
-            "sheets",
-            "v4",
-            credentials=creds,
-            cache_discovery=False,
         )
+        values = response.get("values", [])
+        self._store_values(sheet_range, values, generation)
+        return list(values)
 
-    def read(self, sheet_range: str) -> list[list[str]]:
+    def batch_read(self, sheet_ranges: Sequence[str]) -> list[list[list[str]]]:
+        """Read several ranges in one request; results follow the order of `sheet_ranges`."""
+        cached = [self._cached_values(sheet_range) for sheet_range in sheet_ranges]
+        if all(values is not None for values in cached):
+            return cached  # type: ignore[return-value]
+        generations = [self._generation(sheet_range) for sheet_range in sheet_ranges]
         response = self._execute_with_retry(
-            lambda: self._service.spreadsheets()
-            .values()
-            .get(spreadsheetId=self.spreadsheet_id, range=sheet_range)
-            .execute()
+            lambda: self._values.batchGet(
+                spreadsheetId=self.spreadsheet_id,
+                ranges=list(sheet_ranges),
+                fields="valueRanges.values",
+            )
         )
-        return response.get("values", [])
+        value_ranges = response.get("valueRanges", [])
+        results = [value_range.get("values", []) for value_range in value_ranges]
+        for sheet_range, values, generation in zip(
+            sheet_ranges, results, generations, strict=False
+        ):
+            self._store_values(sheet_range, values, generation)
+        return [list(values) for values in results]
+
+    def invalidate(self, sheet_range: str | None = None) -> None:
+        """Drop cached reads for the sheet named in `sheet_range` (all sheets if omitted)."""
+        with self._cache_lock:
+            if sheet_range is None:
+                self._epoch += 1
+                self._read_cache.clear()
+                return
+            sheet_name = _sheet_name(sheet_range)
+            self._generations[sheet_name] = self._generations.get(sheet_name, 0) + 1
+            prefix = sheet_name + "!"
+            for key in [key for key in self._read_cache if key.startswith(prefix)]:
+                self._read_cache.pop(key, None)
 
     def write(
         self,
@@ -92,41 +155,56 @@ class SheetsClient:
         value_input_option: str = "RAW",
     ) -> None:
         body = {"values": list(values)}
-        self._execute_with_retry(
-            lambda: self._service.spreadsheets()
-            .values()
-            .update(
+        self._execute_write(
+            [sheet_range],
+            lambda: self._values.update(
                 spreadsheetId=self.spreadsheet_id,
                 range=sheet_range,
                 valueInputOption=value_input_option,
                 body=body,
-            )
-            .execute()
+            ),
         )
 
     def clear(self, sheet_range: str) -> None:
-        self._execute_with_retry(
-            lambda: self._service.spreadsheets()
-            .values()
-            .clear(spreadsheetId=self.spreadsheet_id, range=sheet_range, body={})
-            .execute()
+        self._execute_write(
+            [sheet_range],
+            lambda: self._values.clear(
+                spreadsheetId=self.spreadsheet_id, range=sheet_range, body={}
+            ),
+        )
+
+    def batch_clear(self, sheet_ranges: Sequence[str]) -> None:
+        """Clear several ranges in one request."""
+        body = {"ranges": list(sheet_ranges)}
+        self._execute_write(
+            body["ranges"],
+            lambda: self._values.batchClear(spreadsheetId=self.spreadsheet_id, body=body),
         )
 
     def batch_update(self, data: Sequence[dict]) -> None:
         body = {"data": list(data), "valueInputOption": "RAW"}
-        self._execute_with_retry(
-            lambda: self._service.spreadsheets()
-            .values()
-            .batchUpdate(spreadsheetId=self.spreadsheet_id, body=body)
-            .execute()
+        self._execute_write(
+            [item["range"] for item in data],
+            lambda: self._values.batchUpdate(spreadsheetId=self.spreadsheet_id, body=body),
         )
 
-    def _execute_with_retry(self, func: Callable[[], Any]) -> Any:
-        delay = 1.0
+    def _execute_write(self, sheet_ranges: Sequence[str], make_request: Callable[[], Any]) -> Any:
+        try:
+            return self._execute_with_retry(make_request)
+        finally:
+            # Invalidate once the sheet has changed, so reads that were already in
+            # flight (and may have seen the old rows) don't get cached.
+            for sheet_range in sheet_ranges:
+                self.invalidate(sheet_range)
+
+    def _execute_with_retry(self, make_request: Callable[[], Any]) -> Any:
         for attempt in range(1, MAX_RETRIES + 1):
             try:
                 logger.debug("Sheets request attempt %s/%s", attempt, MAX_RETRIES)
-                return func()
+                http = self._thread_http()
+                if http is None:
+                    return make_request().execute()
+                return make_request().execute(http=http)
             except HttpError as err:
                 self._record_error("http_error")
                 logger.warning(
@@ -135,11 +213,14 @@ class SheetsClient:
                     MAX_RETRIES,
                     err,
                 )
-                if attempt == MAX_RETRIES:
+                status = _http_status(err)
+                # 4xx other than 429 won't succeed on retry (bad range, no access).
+                if attempt == MAX_RETRIES or (
+                    status is not None and status not in RETRYABLE_HTTP_STATUSES
+                ):
                     self._emit_alert("http_error", err)
                     raise
-                time.sleep(delay)
-                delay = min(delay * 2, DEFAULT_TIMEOUT)
+                time.sleep(_retry_after(err, status) or _backoff_delay(attempt))
             except RETRYABLE_IO_ERRORS as err:
                 self._record_error("io_error")
                 logger.warning(
@@ -151,16 +232,48 @@ class SheetsClient:
                 if attempt == MAX_RETRIES:
                     self._emit_alert("io_error", err)
                     raise
-                time.sleep(delay)
-                delay = min(delay * 2, DEFAULT_TIMEOUT)
+                time.sleep(_backoff_delay(attempt))
             except Exception as err:  # pragma: no cover - unexpected failures
                 self._record_error("unexpected_error")
                 logger.exception("Unexpected Sheets error on attempt %s: %s", attempt, err)
                 self._emit_alert("unexpected_error", err)
                 raise
 
-    def get_error_stats(self) -> Counter[str]:
-        return Counter(self._error_counts)
+    def _cached_values(self, sheet_range: str) -> list[list[str]] | None:
+        cached = self._read_cache.get(sheet_range)
+        if cached is None or time.monotonic() - cached[0] >= self._read_ttl:
+            return None
+        # Callers append to what they read, so hand out a copy of the row list.
+        return list(cached[1])
+
+    def _generation(self, sheet_range: str) -> tuple[int, int]:
+        return self._epoch, self._generations.get(_sheet_name(sheet_range), 0)
+
+    def _store_values(
+        self, sheet_range: str, values: list[list[str]], generation: tuple[int, int]
+    ) -> None:
+        if self._read_ttl <= 0:
+            return
+        with self._cache_lock:
+            # Skip the store when the sheet was invalidated while the request was in flight.
+            if self._generation(sheet_range) == generation:
+                self._read_cache[sheet_range] = (time.monotonic(), values)
+
+    def _thread_http(self) -> Any | None:
+        if self._credentials is None or AuthorizedHttpClass is None or HttpClass is None:
+            return None
+        pool: dict[int, Any] | None = getattr(_THREAD_HTTP, "pool", None)
+        if pool is None:
+            pool = _THREAD_HTTP.pool = {}
+        key = id(self._credentials)
+        http = pool.get(key)
+        if http is None:
+            http = AuthorizedHttpClass(self._credentials, http=HttpClass(timeout=DEFAULT_TIMEOUT))
+            pool[key] = http
+        return http
+
+    def get_error_stats(self) -> dict[str, int]:
+        return self._error_counts.copy()
 
     def _record_error(self, kind: str) -> None:
         self._error_counts[kind] += 1
@@ -173,3 +286,51 @@ class SheetsClient:
             self._error_notifier(kind, err)
         except Exception as notifier_err:  # pragma: no cover - logging only
             logger.error("Sheets error notifier failed: %s", notifier_err)
+
+
+def _sheet_name(sheet_range: str) -> str:
+    return sheet_range.split("!", 1)[0]
+
+
+def _backoff_delay(attempt: int) -> float:
+    # Full jitter keeps concurrent workers from retrying in lockstep after a 429.
+    return random.uniform(0, min(DEFAULT_TIMEOUT, BACKOFF_BASE_SEC * 2 ** (attempt - 1)))
+
+
+def _http_status(err: Exception) -> int | None:
+    status = getattr(getattr(err, "resp", None), "status", None)
+    try:
+        return int(status) if status is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_after(err: Exception, status: int | None) -> float | None:
+    if status not in (429, 503):
+        return None
+    get_header = getattr(getattr(err, "resp", None), "get", None)
+    raw = get_header("retry-after") if get_header is not None else None
+    try:
+        return min(float(raw), DEFAULT_TIMEOUT) if raw else None
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=8)
+def _build_service(service_account_file: str) -> tuple[Any, Any]:
+    """Load credentials and build the Sheets resource once per key file."""
+    scopes = ["https://www.googleapis.com/auth/spreadsheets"]
+    creds = CredentialsClass.from_service_account_file(  # type: ignore[union-attr]
+        service_account_file,
+        scopes=scopes,
+    )
+    # The sheets/v4 discovery document ships with google-api-python-client;
+    # static_discovery pins the offline copy so a cold start never fetches it.
+    service = BuildCallable(  # type: ignore[misc]
+        "sheets",
+        "v4",
+        credentials=creds,
+        cache_discovery=False,
+        static_discovery=True,
+    )
+    return creds, service
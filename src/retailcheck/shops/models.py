@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ShopInfo:
     shop_id: str
     name: str
@@ -15,3 +15,18 @@ class ShopInfo:
     reminder_slots: dict[str, list[str]]
     allow_anyone: bool
     dual_cash_mode: bool = False
+    manager_keys: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    employee_keys: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Lookup keys for user indexes, normalized once at load time.
+        object.__setattr__(
+            self,
+            "manager_keys",
+            tuple(name.lower().lstrip("@") for name in self.manager_usernames),
+        )
+        object.__setattr__(
+            self,
+            "employee_keys",
+            tuple(name.lower().lstrip("@") for name in self.employee_usernames),
+        )
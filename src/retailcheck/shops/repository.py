@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import os
+import sys
 
 from retailcheck.sheets.client import SheetsClient
 from retailcheck.shops.models import ShopInfo
@@ -12,6 +13,7 @@ DEFAULT_OPEN_TIME = os.getenv("SHOP_DEFAULT_OPEN_TIME", "09:00")
 DEFAULT_CLOSE_TIME = os.getenv("SHOP_DEFAULT_CLOSE_TIME", "21:00")
 DEFAULT_REMINDER_SLOTS: list[str] = []
 ALLOW_ANYONE_DEFAULT = os.getenv("ALLOW_ANYONE_DEFAULT", "FALSE").upper() == "TRUE"
+SHOPS_WIDTH = 12  # Shops!A:L
 
 
 class ShopsRepository:
@@ -31,26 +33,39 @@ class ShopsRepository:
         for row in rows:
             if not row or not row[0].strip():
                 continue
-            is_active = row[10].strip().upper() if len(row) > 10 and row[10] else "TRUE"
-            if is_active == "FALSE":
+            # Pad once so every column below is a plain positional unpack.
+            (
+                shop_id,
+                name,
+                timezone,
+                open_raw,
+                close_raw,
+                managers_raw,
+                employees_raw,
+                slots_raw,
+                allow_raw,
+                dual_raw,
+                active_raw,
+                _,
+            ) = row[:SHOPS_WIDTH] + [""] * (SHOPS_WIDTH - len(row))
+            if active_raw.strip().upper() == "FALSE":
                 continue
-            name = row[1].strip() if len(row) > 1 and row[1].strip() else row[0].strip()
-            timezone = row[2].strip() if len(row) > 2 and row[2].strip() else DEFAULT_TIMEZONE
-            open_time = _normalize_time(row[3] if len(row) > 3 else "", DEFAULT_OPEN_TIME)
-            close_time = _normalize_time(row[4] if len(row) > 4 else "", DEFAULT_CLOSE_TIME)
-            manager_usernames = _parse_usernames(row[5] if len(row) > 5 else "")
-            employee_usernames = _parse_usernames(row[6] if len(row) > 6 else "")
-            slots_raw = row[7] if len(row) > 7 else ""
-            reminder_slots = _parse_slots(slots_raw) if slots_raw.strip() else {}
+            shop_id = shop_id.strip()
+            name = name.strip() or shop_id
+            # Few distinct values across many rows; intern so shops share one string.
+            timezone = sys.intern(timezone.strip() or DEFAULT_TIMEZONE)
+            open_time = _normalize_time(open_raw, DEFAULT_OPEN_TIME)
+            close_time = _normalize_time(close_raw, DEFAULT_CLOSE_TIME)
+            manager_usernames = _parse_usernames(managers_raw)
+            employee_usernames = _parse_usernames(employees_raw)
+            reminder_slots = _parse_slots(slots_raw)
             allow_anyone = (
-                (row[8].strip().upper() == "TRUE")
-                if len(row) > 8 and row[8]
-                else ALLOW_ANYONE_DEFAULT
+                allow_raw.strip().upper() == "TRUE" if allow_raw else ALLOW_ANYONE_DEFAULT
             )
-            dual_cash_mode = row[9].strip().upper() == "TRUE" if len(row) > 9 and row[9] else False
+            dual_cash_mode = dual_raw.strip().upper() == "TRUE"
             shops.append(
                 ShopInfo(
-                    shop_id=row[0].strip(),
+                    shop_id=shop_id,
                     name=name,
                     timezone=timezone,
                     open_time=open_time,
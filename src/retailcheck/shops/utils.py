@@ -1,20 +1,22 @@
 from __future__ import annotations
 
 import json
+import re
 from collections.abc import Iterable
 
+# Tokens are split on commas/whitespace; leading "@"s are dropped and bare "@"s skipped.
+_USERNAME_RE = re.compile(r"@*+([^\s,]+)")
+
 
 def _parse_usernames(raw: str) -> list[str]:
-    cleaned = raw.replace(",", " ")
-    values = [token.strip().lstrip("@") for token in cleaned.split() if token.strip()]
-    return [token for token in values if token]
+    return _USERNAME_RE.findall(raw)
 
 
 def _parse_slots(raw: str) -> dict[str, list[str]]:
     cleaned = (raw or "").strip()
     if not cleaned:
         return {}
-    if cleaned.startswith("{") or cleaned.startswith("["):
+    if cleaned[0] in "{[":
         try:
             payload = json.loads(cleaned)
             if isinstance(payload, dict):
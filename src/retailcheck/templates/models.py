@@ -3,10 +3,11 @@ from __future__ import annotations
 import json
 from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TemplateStepDefinition:
     step_order: int
     code: str
@@ -33,7 +34,7 @@ class TemplateStepDefinition:
         ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TemplateDefinition:
     template_id: str
     name: str
@@ -54,9 +55,16 @@ class TemplateDefinition:
 
 
 def load_template_definition(path: Path) -> TemplateDefinition:
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    # Keyed on mtime as well, so an edited file is parsed again.
+    return _load_cached(str(path.resolve()), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=64)
+def _load_cached(path: str, _mtime_ns: int) -> TemplateDefinition:
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
     template_data = payload["template"]
-    steps = [
+    # A tuple keeps the shared cached definition immutable.
+    steps = tuple(
         TemplateStepDefinition(
             step_order=step["step_order"],
             code=step["code"],
@@ -69,7 +77,7 @@ def load_template_definition(path: Path) -> TemplateDefinition:
             owner_role=step.get("owner_role", "shared"),
         )
         for step in payload["steps"]
-    ]
+    )
     return TemplateDefinition(
         template_id=template_data["template_id"],
         name=template_data["name"],
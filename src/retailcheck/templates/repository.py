@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
+from operator import attrgetter
 
 from retailcheck.sheets.client import SheetsClient
 from retailcheck.templates.models import TemplateDefinition, TemplateStepDefinition
 
+TEMPLATE_STEPS_WIDTH = 10  # TemplateSteps!A:J
+_step_order = attrgetter("step_order")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TemplateCache:
     templates: dict[str, TemplateDefinition]
+    by_phase: dict[str, list[TemplateDefinition]]
 
 
 class TemplateRepository:
@@ -26,33 +32,45 @@ class TemplateRepository:
         if self._cache:
             return self._cache
         templates = self._load_templates()
-        self._cache = TemplateCache(templates=templates)
+        by_phase: dict[str, list[TemplateDefinition]] = {}
+        for tmpl in templates.values():
+            by_phase.setdefault(tmpl.phase, []).append(tmpl)
+        self._cache = TemplateCache(templates=templates, by_phase=by_phase)
         return self._cache
 
     def _load_templates(self) -> dict[str, TemplateDefinition]:
-        template_rows = self._sheets.read("Templates!A2:F")
-        step_rows = self._sheets.read("TemplateSteps!A2:J")
+        template_rows, step_rows = self._sheets.batch_read(["Templates!A2:F", "TemplateSteps!A2:J"])
         steps_by_template: dict[str, list[TemplateStepDefinition]] = {}
         for row in step_rows:
             if not row or not row[0]:
                 continue
-            padded = row + [""] * (10 - len(row))
+            (
+                template_id,
+                order_raw,
+                code,
+                title,
+                step_type,
+                required,
+                validators_json,
+                norm_rule,
+                hint,
+                owner_role,
+            ) = row[:TEMPLATE_STEPS_WIDTH] + [""] * (TEMPLATE_STEPS_WIDTH - len(row))
             try:
-                order = int(padded[1])
+                order = int(order_raw)
             except ValueError:
                 continue
-            template_id = padded[0]
             steps_by_template.setdefault(template_id, []).append(
                 TemplateStepDefinition(
                     step_order=order,
-                    code=padded[2],
-                    title=padded[3],
-                    type=padded[4],
-                    required=padded[5].upper() == "TRUE",
-                    validators_json=padded[6] or None,
-                    norm_rule=padded[7] or None,
-                    hint=padded[8] or None,
-                    owner_role=padded[9] or "shared",
+                    code=code,
+                    title=title,
+                    type=sys.intern(step_type),
+                    required=required.upper() == "TRUE",
+                    validators_json=validators_json or None,
+                    norm_rule=norm_rule or None,
+                    hint=hint or None,
+                    owner_role=sys.intern(owner_role or "shared"),
                 )
             )
         templates: dict[str, TemplateDefinition] = {}
@@ -64,15 +82,17 @@ class TemplateRepository:
                 template_id=template_id,
                 name=row[1],
                 version=int(row[2]),
-                phase=row[3],
+                phase=sys.intern(row[3]),
                 description=row[5] if len(row) > 5 else "",
-                steps=sorted(steps_by_template.get(template_id, []), key=lambda s: s.step_order),
+                steps=sorted(steps_by_template.get(template_id, []), key=_step_order),
             )
         return templates
 
     def refresh(self) -> None:
         """Invalidate cache (call when Templates sheet changed)."""
         self._cache = None
+        self._sheets.invalidate("Templates")
+        self._sheets.invalidate("TemplateSteps")
 
     def get(self, template_id: str) -> TemplateDefinition:
         cache = self._ensure_cache()
@@ -83,4 +103,4 @@ class TemplateRepository:
 
     def list_by_phase(self, phase: str) -> list[TemplateDefinition]:
         cache = self._ensure_cache()
-        return [tmpl for tmpl in cache.templates.values() if tmpl.phase == phase]
+        return list(cache.by_phase.get(phase, ()))
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+def normalize_username(username: str) -> str:
+    """Lookup form of a Telegram username: lower-case, without the leading @."""
+    return username.lower().lstrip("@")
+
+
+@dataclass(frozen=True, slots=True)
 class UserRecord:
     user_id: str
     tg_id: int
@@ -12,6 +17,12 @@ class UserRecord:
     role: str
     shops: list[str]
     is_active: bool
+    username_key: str | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Lookup key for user indexes, normalized once at load time.
+        key = normalize_username(self.username) if self.username else None
+        object.__setattr__(self, "username_key", key or None)
 
     def can_work_in_shop(self, shop_id: str) -> bool:
         return shop_id in self.shops
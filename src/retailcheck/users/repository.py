@@ -1,20 +1,43 @@
 from __future__ import annotations
 
 import asyncio
+import re
+import sys
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
 
 from retailcheck.sheets.client import SheetsClient
-from retailcheck.users.models import UserRecord
+from retailcheck.users.models import UserRecord, normalize_username
+
+USERS_CACHE_TTL_SEC = 30.0
+USERS_WIDTH = 8  # Users!A:H
+# Comma-separated shop ids with surrounding whitespace trimmed and empty entries dropped.
+_SHOP_IDS_RE = re.compile(r"[^,\s]+(?:\s+[^,\s]+)*")
+
+
+@dataclass(frozen=True, slots=True)
+class UsersSnapshot:
+    records: list[UserRecord]
+    by_username: dict[str, UserRecord]
+    by_tg_id: dict[int, UserRecord]
 
 
 class UsersRepository:
     """Read-only repository for Users sheet."""
 
-    def __init__(self, sheets: SheetsClient) -> None:
+    def __init__(self, sheets: SheetsClient, cache_ttl: float = USERS_CACHE_TTL_SEC) -> None:
         self._sheets = sheets
+        self._cache_ttl = cache_ttl
+        self._snapshot_cache: tuple[float, UsersSnapshot] | None = None
 
     async def get_by_username(self, username: str) -> UserRecord | None:
         return await asyncio.to_thread(self._get_by_username_sync, username)
 
+    async def get_by_usernames(self, usernames: Iterable[str]) -> dict[str, UserRecord]:
+        """Resolve several usernames from one snapshot; unknown names are omitted."""
+        return await asyncio.to_thread(self._get_by_usernames_sync, list(usernames))
+
     async def list_active(self) -> list[UserRecord]:
         return await asyncio.to_thread(self._list_active_sync)
 
@@ -24,42 +47,63 @@ class UsersRepository:
     # --- sync helpers -------------------------------------------------
 
     def _get_by_username_sync(self, username: str) -> UserRecord | None:
-        normalized = username.lower()
-        for record in self._list_all():
-            if record.username and record.username.lower() == normalized:
-                return record
-        return None
+        return self._snapshot().by_username.get(normalize_username(username))
+
+    def _get_by_usernames_sync(self, usernames: list[str]) -> dict[str, UserRecord]:
+        by_username = self._snapshot().by_username
+        found: dict[str, UserRecord] = {}
+        for username in usernames:
+            record = by_username.get(normalize_username(username))
+            if record:
+                found[username] = record
+        return found
 
     def _get_by_tg_id_sync(self, tg_id: int) -> UserRecord | None:
-        for record in self._list_all():
-            if record.tg_id == tg_id:
-                return record
-        return None
+        return self._snapshot().by_tg_id.get(tg_id)
 
     def _list_active_sync(self) -> list[UserRecord]:
-        return [record for record in self._list_all() if record.is_active]
+        return [record for record in self._snapshot().records if record.is_active]
+
+    def _snapshot(self) -> UsersSnapshot:
+        cached = self._snapshot_cache
+        if cached and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+        records = self._list_all()
+        by_username: dict[str, UserRecord] = {}
+        by_tg_id: dict[int, UserRecord] = {}
+        for record in records:
+            # setdefault keeps the first matching row, as the old linear scans did.
+            # Same key as UserRecord.username_key and the shop *_keys, so a leading
+            # "@" on either side of a lookup doesn't matter.
+            if record.username_key:
+                by_username.setdefault(record.username_key, record)
+            by_tg_id.setdefault(record.tg_id, record)
+        snapshot = UsersSnapshot(records=records, by_username=by_username, by_tg_id=by_tg_id)
+        self._snapshot_cache = (time.monotonic(), snapshot)
+        return snapshot
 
     def _list_all(self) -> list[UserRecord]:
-        rows = self._sheets.read("Users!A2:H")
+        # The snapshot has its own TTL; bypass the client cache so the two don't stack.
+        rows = self._sheets.read("Users!A2:H", fresh=True)
         records: list[UserRecord] = []
         for row in rows:
             if not row or not row[0].strip():
                 continue
-            username = row[2].strip() if len(row) > 2 and row[2] else None
-            full_name = row[3].strip() if len(row) > 3 and row[3] else (username or row[0].strip())
-            shops_raw = row[5] if len(row) > 5 else ""
-            shops = [shop.strip() for shop in shops_raw.split(",") if shop.strip()]
-            is_active = (row[6].strip().upper() == "TRUE") if len(row) > 6 and row[6] else True
-            tg_id = int(row[1]) if len(row) > 1 and row[1] else 0
+            padded = row[:USERS_WIDTH] + [""] * (USERS_WIDTH - len(row))
+            user_id, tg_raw, username_raw, name_raw, role_raw, shops_raw, active_raw, _ = padded
+            user_id = user_id.strip()
+            username = username_raw.strip() if username_raw else None
+            full_name = name_raw.strip() if name_raw else (username or user_id)
             records.append(
                 UserRecord(
-                    user_id=row[0].strip(),
-                    tg_id=tg_id,
+                    user_id=user_id,
+                    tg_id=int(tg_raw) if tg_raw else 0,
                     username=username,
                     full_name=full_name,
-                    role=row[4].strip() if len(row) > 4 else "employee",
-                    shops=shops,
-                    is_active=is_active,
+                    # A missing role column means a plain employee; an empty cell stays empty.
+                    role=sys.intern(role_raw.strip()) if len(row) > 4 else "employee",
+                    shops=_SHOP_IDS_RE.findall(shops_raw),
+                    is_active=active_raw.strip().upper() == "TRUE" if active_raw else True,
                 )
             )
         return records
@@ -1,10 +1,84 @@
+from dataclasses import replace
+from types import MappingProxyType
+
+import pytest
+
 from retailcheck.attachments.models import AttachmentRecord
 from retailcheck.bot.handlers import status
 from retailcheck.runs.models import RunRecord
 from retailcheck.runsteps.models import RunStepRecord
 
-
-def make_run():
+# Requirement metas are immutable, so they are built once at import and shared.
+_META_CASH = status.StepRequirementMeta(
+    code="cash",
+    title="Касса 19:00",
+    owner_role="closer",
+    required=True,
+    step_type="number",
+    validators={},
+)
+_META_Z_PHOTO = status.StepRequirementMeta(
+    code="z_report_photo",
+    title="Z-фото",
+    owner_role="closer",
+    required=True,
+    step_type="photo",
+    validators={},
+)
+_META_CASH_FLOAT_OPEN = status.StepRequirementMeta(
+    code="cash_float_open",
+    title="Касса открытие",
+    owner_role="opener",
+    required=True,
+    step_type="number",
+    validators={},
+)
+_META_SHARED_NOTE = status.StepRequirementMeta(
+    code="shared_note",
+    title="Общий комментарий",
+    owner_role="shared",
+    required=True,
+    step_type="text",
+    validators={},
+)
+_META_TERMINAL = status.StepRequirementMeta(
+    code="photo_terminal_1",
+    title="Сверка терминала",
+    owner_role="shared",
+    required=True,
+    step_type="photo",
+    validators={},
+)
+_META_DELTA_COMMENT = status.StepRequirementMeta(
+    code="delta_comment",
+    title="Комментарий",
+    owner_role="closer",
+    required=False,
+    step_type="text",
+    validators={"delta_threshold": 50},
+)
+_META_DELTA_PHOTO = status.StepRequirementMeta(
+    code="delta_photo",
+    title="Фото расхождения",
+    owner_role="closer",
+    required=False,
+    step_type="photo",
+    validators={"delta_threshold": 20},
+)
+_META_TERMINAL_PHOTO = status.StepRequirementMeta(
+    code="photo_terminal_1",
+    title="Сверка терминала (фото)",
+    owner_role="shared",
+    required=True,
+    step_type="photo",
+    validators={},
+)
+_CLOSE_REQUIREMENTS = MappingProxyType({"cash": _META_CASH, "z_report_photo": _META_Z_PHOTO})
+
+
+@pytest.fixture(scope="module")
+def base_run() -> RunRecord:
+    # Shared template; tests take a replace() copy before customising it.
     return RunRecord(
         run_id="run",
         date="2025-02-01",
@@ -15,17 +89,15 @@ def make_run():
     )
 
 
-def test_format_status():
-    run = make_run()
-    run.opener_username = "user1"
+def test_format_status(base_run: RunRecord):
+    run = replace(base_run, opener_username="user1")
     text = status._format_status(run, 3)  # noqa: SLF001
     assert "user1" in text
     assert "3" in text
 
 
-def test_format_summary():
-    run = make_run()
-    run.opener_username = "user1"
+def test_format_summary(base_run: RunRecord):
+    run = replace(base_run, opener_username="user1")
     steps = [
         RunStepRecord(
             run_id="run",
@@ -50,30 +122,12 @@ def test_format_summary():
             kind="z",
         )
     ]
-    requirements = {
-        "cash": status.StepRequirementMeta(
-            code="cash",
-            title="Касса 19:00",
-            owner_role="closer",
-            required=True,
-            step_type="number",
-            validators={},
-        ),
-        "z_report_photo": status.StepRequirementMeta(
-            code="z_report_photo",
-            title="Z-фото",
-            owner_role="closer",
-            required=True,
-            step_type="photo",
-            validators={},
-        ),
-    }
     summary = status._format_summary(  # noqa: SLF001
         run,
         steps,
         attachments,
         dual_mode=False,
-        requirements=requirements,
+        requirements=_CLOSE_REQUIREMENTS,
     )
     assert "Касса 19:00" in summary
     assert "Комментарий" in summary
@@ -95,89 +149,52 @@ def test_missing_comments():
     assert missing == ["cash"]
 
 
-def test_missing_required_steps_detects_roles():
-    meta = {
-        "cash_float_open": status.StepRequirementMeta(
-            code="cash_float_open",
-            title="Касса открытие",
-            owner_role="opener",
-            required=True,
-            step_type="number",
-            validators={},
+@pytest.mark.parametrize(
+    ("meta", "steps", "expected"),
+    [
+        pytest.param(
+            {"cash_float_open": _META_CASH_FLOAT_OPEN, "z_report_photo": _META_Z_PHOTO},
+            [],
+            {"opener": ["cash_float_open"], "closer": ["z_report_photo"]},
+            id="detects_roles",
         ),
-        "z_report_photo": status.StepRequirementMeta(
-            code="z_report_photo",
-            title="Z-фото",
-            owner_role="closer",
-            required=True,
-            step_type="photo",
-            validators={},
+        pytest.param(
+            {"shared_note": _META_SHARED_NOTE},
+            [
+                RunStepRecord(
+                    run_id="run",
+                    phase="close",
+                    step_code="shared_note",
+                    owner_role="opener",
+                    value_text="done",
+                    status="ok",
+                )
+            ],
+            {},
+            id="shared_uses_any_role",
         ),
-    }
-    missing = status._missing_required_steps(meta, [])  # noqa: SLF001
-    assert missing == {"opener": ["cash_float_open"], "closer": ["z_report_photo"]}
-
-
-def test_missing_required_shared_uses_any_role():
-    meta = {
-        "shared_note": status.StepRequirementMeta(
-            code="shared_note",
-            title="Общий комментарий",
-            owner_role="shared",
-            required=True,
-            step_type="text",
-            validators={},
-        )
-    }
-    steps = [
-        RunStepRecord(
-            run_id="run",
-            phase="close",
-            step_code="shared_note",
-            owner_role="opener",
-            value_text="done",
-            status="ok",
-        )
-    ]
-    missing = status._missing_required_steps(meta, steps)  # noqa: SLF001
-    assert missing == {}
-
-
-def test_missing_required_terminal_demands_both_roles():
-    meta = {
-        "photo_terminal_1": status.StepRequirementMeta(
-            code="photo_terminal_1",
-            title="Сверка терминала",
-            owner_role="shared",
-            required=True,
-            step_type="photo",
-            validators={},
-        )
-    }
-    steps = [
-        RunStepRecord(
-            run_id="run",
-            phase="finance",
-            step_code="photo_terminal_1",
-            owner_role="opener",
-            status="ok",
-        )
-    ]
-    missing = status._missing_required_steps(meta, steps)  # noqa: SLF001
-    assert missing == {"closer": ["photo_terminal_1"]}
+        pytest.param(
+            {"photo_terminal_1": _META_TERMINAL},
+            [
+                RunStepRecord(
+                    run_id="run",
+                    phase="finance",
+                    step_code="photo_terminal_1",
+                    owner_role="opener",
+                    status="ok",
+                )
+            ],
+            {"closer": ["photo_terminal_1"]},
+            id="terminal_demands_both_roles",
+        ),
+    ],
+)
+def test_missing_required_steps(meta, steps, expected):
+    assert status._missing_required_steps(meta, steps) == expected  # noqa: SLF001
 
 
 def test_conditional_comment_requirement_triggers():
-    meta = {
-        "delta_comment": status.StepRequirementMeta(
-            code="delta_comment",
-            title="Комментарий",
-            owner_role="closer",
-            required=False,
-            step_type="text",
-            validators={"delta_threshold": 50},
-        )
-    }
+    meta = {"delta_comment": _META_DELTA_COMMENT}
     steps = [
         RunStepRecord(run_id="run", phase="close", step_code="cash", delta_number="70", status="ok")
     ]
@@ -187,16 +204,7 @@ def test_conditional_comment_requirement_triggers():
 
 
 def test_conditional_photo_requirement_uses_attachments():
-    meta = {
-        "delta_photo": status.StepRequirementMeta(
-            code="delta_photo",
-            title="Фото расхождения",
-            owner_role="closer",
-            required=False,
-            step_type="photo",
-            validators={"delta_threshold": 20},
-        )
-    }
+    meta = {"delta_photo": _META_DELTA_PHOTO}
     steps = [
         RunStepRecord(run_id="run", phase="close", step_code="cash", delta_number="25", status="ok")
     ]
@@ -213,16 +221,7 @@ def test_conditional_photo_requirement_uses_attachments():
 
 
 def test_attachments_summary_uses_role_hint():
-    requirements = {
-        "photo_terminal_1": status.StepRequirementMeta(
-            code="photo_terminal_1",
-            title="Сверка терминала (фото)",
-            owner_role="shared",
-            required=True,
-            step_type="photo",
-            validators={},
-        )
-    }
+    requirements = {"photo_terminal_1": _META_TERMINAL_PHOTO}
     attachments = [
         AttachmentRecord(
             run_id="run",
@@ -48,8 +48,14 @@ def test_parse_number_value():
         steps._parse_number_value("-1", {"min": 0})  # noqa: SLF001
 
 
-def test_parse_bool_value():
-    assert steps._parse_bool_value("да") is True  # noqa: SLF001
-    assert steps._parse_bool_value("No") is False  # noqa: SLF001
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [("да", True), (" OK ", True), ("No", False), ("нет", False)],
+)
+def test_parse_bool_value(text: str, expected: bool):
+    assert steps._parse_bool_value(text) is expected  # noqa: SLF001
+
+
+def test_parse_bool_value_rejects_unknown_token():
     with pytest.raises(ValueError):
         steps._parse_bool_value("maybe")  # noqa: SLF001
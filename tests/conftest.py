@@ -1,11 +1,10 @@
-import asyncio
-import functools
+import pytest
+from pytest_asyncio import is_async_test
 
-if not hasattr(asyncio, "to_thread"):
 
-    async def _to_thread(func, *args, **kwargs):
-        loop = asyncio.get_event_loop()
-        bound = functools.partial(func, *args, **kwargs)
-        return await loop.run_in_executor(None, bound)
-
-    asyncio.to_thread = _to_thread  # type: ignore[attr-defined]
+def pytest_collection_modifyitems(items):
+    # Run every async test on one session-wide loop instead of a fresh loop per test.
+    session_scope = pytest.mark.asyncio(scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_scope, append=False)
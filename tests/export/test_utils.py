@@ -7,6 +7,60 @@ from retailcheck.attachments.models import AttachmentRecord
 from retailcheck.export.utils import append_export_record
 from retailcheck.runsteps.models import RunStepRecord
 
+# Records are never mutated by append_export_record, so one set serves the test module.
+_STEPS = (
+    RunStepRecord(
+        run_id="run_001",
+        phase="close",
+        step_code="close_cash_end",
+        owner_role="closer",
+        value_number="1200.00",
+        delta_number="30",
+        comment="касса +30",
+        status="ok",
+    ),
+    RunStepRecord(
+        run_id="run_001",
+        phase="finance",
+        step_code="fin_sberbank_sum",
+        owner_role="closer",
+        value_number="300.00",
+        delta_number="-5",
+        comment="эквайринг -5",
+        status="ok",
+    ),
+    RunStepRecord(
+        run_id="run_001",
+        phase="finance",
+        step_code="fin_z_photo",
+        owner_role="closer",
+        value_text="photo:file_z",
+        status="ok",
+    ),
+    RunStepRecord(
+        run_id="run_001",
+        phase="finance",
+        step_code="fin_receipts_photo",
+        owner_role="closer",
+        value_text="photo:file_receipt",
+        status="ok",
+    ),
+)
+_ATTACHMENTS = (
+    AttachmentRecord(
+        run_id="run_001",
+        step_code="fin_z_photo",
+        telegram_file_id="file_z",
+        kind="z_report",
+    ),
+    AttachmentRecord(
+        run_id="run_001",
+        step_code="fin_receipts_photo",
+        telegram_file_id="file_receipt",
+        kind="pos_receipt",
+    ),
+)
+
 
 class FakeExportRepository:
     def __init__(self) -> None:
@@ -57,61 +111,9 @@ class DummyRun:
 
 @pytest.mark.asyncio
 async def test_append_export_record_populates_extended_fields():
-    steps = [
-        RunStepRecord(
-            run_id="run_001",
-            phase="close",
-            step_code="close_cash_end",
-            owner_role="closer",
-            value_number="1200.00",
-            delta_number="30",
-            comment="касса +30",
-            status="ok",
-        ),
-        RunStepRecord(
-            run_id="run_001",
-            phase="finance",
-            step_code="fin_sberbank_sum",
-            owner_role="closer",
-            value_number="300.00",
-            delta_number="-5",
-            comment="эквайринг -5",
-            status="ok",
-        ),
-        RunStepRecord(
-            run_id="run_001",
-            phase="finance",
-            step_code="fin_z_photo",
-            owner_role="closer",
-            value_text="photo:file_z",
-            status="ok",
-        ),
-        RunStepRecord(
-            run_id="run_001",
-            phase="finance",
-            step_code="fin_receipts_photo",
-            owner_role="closer",
-            value_text="photo:file_receipt",
-            status="ok",
-        ),
-    ]
-    attachments = [
-        AttachmentRecord(
-            run_id="run_001",
-            step_code="fin_z_photo",
-            telegram_file_id="file_z",
-            kind="z_report",
-        ),
-        AttachmentRecord(
-            run_id="run_001",
-            step_code="fin_receipts_photo",
-            telegram_file_id="file_receipt",
-            kind="pos_receipt",
-        ),
-    ]
     export_repo = FakeExportRepository()
-    steps_repo = FakeRunStepsRepository(steps)
-    attachments_repo = FakeAttachmentsRepository(attachments)
+    steps_repo = FakeRunStepsRepository(_STEPS)
+    attachments_repo = FakeAttachmentsRepository(_ATTACHMENTS)
     shops_repo = FakeShopsRepository()
 
     record, total_delta = await append_export_record(
@@ -122,14 +124,32 @@ async def test_append_export_record_populates_extended_fields():
         shops_repository=shops_repo,
     )
 
-    assert total_delta == pytest.approx(25.0)
-    assert record.shop_name == "Магазин 1"
-    assert record.cash_total == "1200.00"
-    assert record.noncash_total == "300.00"
-    assert record.delta_comment == "касса +30; эквайринг -5"
-    assert "closer:fin_receipts_photo:pos_receipt=file_receipt" in record.attachments_summary
-    assert "closer:fin_z_photo:z_report=file_z" in record.attachments_summary
-    totals = json.loads(record.totals_json)
-    assert totals["closer"]["close_cash_end"] == "1200.00"
-    assert totals["closer"]["fin_sberbank_sum"] == "300.00"
+    assert {
+        "total_delta": total_delta,
+        "shop_name": record.shop_name,
+        "cash_total": record.cash_total,
+        "noncash_total": record.noncash_total,
+        "delta_comment": record.delta_comment,
+    } == {
+        "total_delta": pytest.approx(25.0),
+        "shop_name": "Магазин 1",
+        "cash_total": "1200.00",
+        "noncash_total": "300.00",
+        "delta_comment": "касса +30; эквайринг -5",
+    }
+    items = record.attachments_items
+    assert ("closer", "fin_receipts_photo", "pos_receipt", "file_receipt") in items
+    assert ("closer", "fin_z_photo", "z_report", "file_z") in items
+    assert record.attachments_summary == (
+        "closer:fin_receipts_photo:pos_receipt=file_receipt, closer:fin_z_photo:z_report=file_z"
+    )
+    assert record.totals == {
+        "closer": {
+            "close_cash_end": "1200.00",
+            "fin_receipts_photo": "photo:file_receipt",
+            "fin_sberbank_sum": "300.00",
+            "fin_z_photo": "photo:file_z",
+        }
+    }
+    assert json.loads(record.totals_json) == record.totals
     assert export_repo.records and export_repo.records[0] is record
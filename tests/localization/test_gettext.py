@@ -5,3 +5,8 @@ def test_gettext_returns_russian_strings():
     assert gettext("start.button.open") == "🟢 Открыть смену"
     assert "Магазин" in gettext("start.choose_action", shop="Магазин 1")
     assert gettext("steps.button.back").startswith("⬅️")
+
+
+def test_gettext_falls_back_to_key_for_unknown_entries():
+    assert gettext("missing.key") == "missing.key"
+    assert gettext("missing.key") == "missing.key"
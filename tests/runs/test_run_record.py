@@ -82,3 +82,31 @@ def test_from_row_phase_map_no_active():
     record = RunRecord.from_row(row)
     assert record.template_phase_map["close"] == "close_v1"
     assert record.current_active_user_id is None
+
+
+def test_from_row_phase_map_is_not_shared_between_records():
+    row = [
+        "run_a",
+        "2025-03-01",
+        "shop_1",
+        "opened",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "open_v1",
+        "close_v1",
+        '{"open":"open_v1","close":"close_v1"}',
+        "",
+        "",
+        "1",
+        "2025-03-01T07:50:00Z",
+        "",
+    ]
+    first = RunRecord.from_row(row)
+    first.template_phase_map["finance"] = "finance_v1"
+    second = RunRecord.from_row(row)
+    assert "finance" not in second.template_phase_map
@@ -1,10 +1,13 @@
 import asyncio
 from collections import defaultdict
+from contextlib import asynccontextmanager
 from datetime import date
+from types import MappingProxyType
 
 import pytest
 
 from retailcheck.config import TemplateDefaults
+from retailcheck.runs import service as service_module
 from retailcheck.runs.models import RunRecord
 from retailcheck.runs.service import (
     RoleAlreadyTakenError,
@@ -16,12 +19,14 @@ from retailcheck.runs.service import (
 
 class InMemoryRunsRepository:
     def __init__(self) -> None:
-        self.records: dict[str, RunRecord] = {}
+        self.records: dict[tuple[str, str], RunRecord] = {}
+        self.saves = 0
 
-    async def get_run(self, shop_id: str, date: str):
+    async def get_run(self, shop_id: str, date: str, *, fresh: bool = False):
         return self.records.get((shop_id, date))
 
     async def save_run(self, record: RunRecord):
+        self.saves += 1
         self.records[(record.shop_id, record.date)] = record
 
 
@@ -30,40 +35,39 @@ class InMemoryRedis:
         self._locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
 
     def lock(self, name: str, timeout: int):
-        lock = self._locks[name]
-
-        class _Wrapper:
-            def __init__(self, inner: asyncio.Lock):
-                self._inner = inner
-
-            async def __aenter__(self):
-                await self._inner.acquire()
-                return self
-
-            async def __aexit__(self, exc_type, exc, tb):
-                self._inner.release()
-
-        return _Wrapper(lock)
+        return _hold(self._locks[name])
 
     async def close(self) -> None:
         return None
 
 
-@pytest.fixture
-def run_service(event_loop):
-    repo = InMemoryRunsRepository()
-    redis = InMemoryRedis()
-    templates = TemplateDefaults(
-        {
-            "open": "opening_v1",
-            "check_1100": "closing_v1",
-            "check_1600": "closing_v1",
-            "check_1900": "closing_v1",
-            "close": "closing_v1",
-            "finance": "closing_v1",
-        }
+@asynccontextmanager
+async def _hold(lock: asyncio.Lock):
+    async with lock:
+        yield
+
+
+@pytest.fixture(scope="session")
+def template_defaults() -> TemplateDefaults:
+    # Immutable, so one instance serves the whole session.
+    return TemplateDefaults(
+        MappingProxyType(
+            {
+                "open": "opening_v1",
+                "check_1100": "closing_v1",
+                "check_1600": "closing_v1",
+                "check_1900": "closing_v1",
+                "close": "closing_v1",
+                "finance": "closing_v1",
+            }
+        )
     )
-    return RunService(repo, redis, templates, lock_ttl=1)
+
+
+@pytest.fixture
+def run_service(template_defaults: TemplateDefaults):
+    # Repository and locks stay per test: asyncio locks bind to the running loop.
+    return RunService(InMemoryRunsRepository(), InMemoryRedis(), template_defaults, lock_ttl=1)
 
 
 @pytest.mark.asyncio
@@ -86,6 +90,17 @@ async def test_assign_opener_same_user(run_service: RunService):
     assert result.run.status == "in_progress"
 
 
+@pytest.mark.asyncio
+async def test_assign_opener_same_user_skips_redundant_save(run_service: RunService):
+    repo = run_service._repository  # noqa: SLF001
+    user = RunUser(user_id=1, username="tester", full_name="Tester")
+    await run_service.assign_role("shop_1", "open", user)
+    saves = repo.saves
+    result = await run_service.assign_role("shop_1", "open", user)
+    assert result.state == "already_holder"
+    assert repo.saves == saves
+
+
 @pytest.mark.asyncio
 async def test_assign_opener_other_user_conflict(run_service: RunService):
     user1 = RunUser(user_id=1, username="tester1", full_name="Tester 1")
@@ -155,3 +170,17 @@ async def test_return_run_clears_finish_and_active(run_service: RunService):
     assert returned.finished_at is None
     assert returned.current_active_user_id is None
     assert returned.comment == "Нет Z"
+
+
+def test_today_follows_the_calendar_date(run_service: RunService, monkeypatch):
+    class _Clock(date):
+        current = date(2025, 3, 30)
+
+        @classmethod
+        def today(cls):
+            return cls.current
+
+    monkeypatch.setattr(service_module, "date", _Clock)
+    assert run_service._today() == "2025-03-30"  # noqa: SLF001
+    _Clock.current = date(2025, 3, 31)
+    assert run_service._today() == "2025-03-31"  # noqa: SLF001
@@ -0,0 +1,119 @@
+import pytest
+
+from retailcheck.runs.models import RunRecord
+from retailcheck.runs.repository import RunsRepository
+
+
+class CountingSheets:
+    def __init__(self) -> None:
+        self.rows: list[list[str]] = []
+        self.reads = 0
+
+    def read(self, sheet_range: str, *, fresh: bool = False):
+        self.reads += 1
+        return [list(row) for row in self.rows]
+
+    def clear(self, sheet_name: str):
+        self.rows = []
+
+    def write(self, sheet_range: str, values):
+        start = int(sheet_range.split("!A")[1]) - 2  # stored rows exclude the header
+        for offset, row in enumerate(values):
+            idx = start + offset
+            if idx < 0:
+                continue
+            self.rows.extend([] for _ in range(idx + 1 - len(self.rows)))
+            self.rows[idx] = list(row)
+
+
+@pytest.mark.asyncio
+async def test_get_run_reuses_cached_rows():
+    sheets = CountingSheets()
+    repo = RunsRepository(sheets)  # type: ignore[arg-type]
+    await repo.save_run(
+        RunRecord(run_id="run_1", date="2025-01-01", shop_id="shop_1", status="opened")
+    )
+    reads_after_save = sheets.reads
+
+    first = await repo.get_run("shop_1", "2025-01-01")
+    second = await repo.get_run("shop_1", "2025-01-01")
+
+    assert first is not None and first.run_id == "run_1"
+    assert second is not None and second is not first
+    assert await repo.get_run("shop_2", "2025-01-01") is None
+    assert sheets.reads == reads_after_save
+
+
+@pytest.mark.asyncio
+async def test_save_run_reads_fresh_rows():
+    sheets = CountingSheets()
+    repo = RunsRepository(sheets)  # type: ignore[arg-type]
+    await repo.list_runs()
+    sheets.rows.append(
+        RunRecord(run_id="external", date="2025-01-01", shop_id="shop_2", status="opened").to_row()
+    )
+
+    await repo.save_run(
+        RunRecord(run_id="run_1", date="2025-01-01", shop_id="shop_1", status="opened")
+    )
+
+    assert {record.run_id for record in await repo.list_runs()} == {"external", "run_1"}
+
+
+@pytest.mark.asyncio
+async def test_save_run_rewrites_only_its_row():
+    sheets = CountingSheets()
+    repo = RunsRepository(sheets)  # type: ignore[arg-type]
+    first = RunRecord(run_id="run_1", date="2025-01-01", shop_id="shop_1", status="opened")
+    second = RunRecord(run_id="run_2", date="2025-01-01", shop_id="shop_2", status="opened")
+    await repo.save_run(first)
+    await repo.save_run(second)
+
+    first.status = "closed"
+    await repo.save_run(first)
+
+    assert [row[0] for row in sheets.rows] == ["run_1", "run_2"]
+    assert sheets.rows[0][3] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_get_by_run_id():
+    sheets = CountingSheets()
+    repo = RunsRepository(sheets)  # type: ignore[arg-type]
+    await repo.save_run(
+        RunRecord(run_id="run_1", date="2025-01-01", shop_id="shop_1", status="opened")
+    )
+    await repo.save_run(
+        RunRecord(run_id="run_2", date="2025-01-02", shop_id="shop_1", status="opened")
+    )
+
+    record = await repo.get_by_run_id("run_2")
+
+    assert record is not None and record.date == "2025-01-02"
+    assert await repo.get_by_run_id("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_read_overlapping_a_save_does_not_refill_cache():
+    sheets = CountingSheets()
+    repo = RunsRepository(sheets)  # type: ignore[arg-type]
+    await repo.save_run(
+        RunRecord(run_id="run_1", date="2025-01-01", shop_id="shop_1", status="opened")
+    )
+    repo._rows_cache = None  # noqa: SLF001 - force the next read to hit the sheet
+    original_read = sheets.read
+
+    def read_racing_a_save(sheet_range: str, *, fresh: bool = False):
+        rows = original_read(sheet_range, fresh=fresh)
+        sheets.read = original_read
+        # The save lands while this read is still in flight.
+        repo._save_run_sync(  # noqa: SLF001
+            RunRecord(run_id="run_1", date="2025-01-01", shop_id="shop_1", status="closed")
+        )
+        return rows
+
+    sheets.read = read_racing_a_save  # type: ignore[method-assign]
+    in_flight = await repo.get_run("shop_1", "2025-01-01")
+    assert in_flight is not None and in_flight.status == "opened"
+    record = await repo.get_run("shop_1", "2025-01-01")
+    assert record is not None and record.status == "closed"
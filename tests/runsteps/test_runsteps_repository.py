@@ -7,8 +7,10 @@ from retailcheck.runsteps.repository import RunStepsRepository
 class FakeSheets:
     def __init__(self) -> None:
         self.data = {"RunSteps": []}
+        self.reads = 0
 
-    def read(self, sheet_range: str):
+    def read(self, sheet_range: str, *, fresh: bool = False):
+        self.reads += 1
         sheet = sheet_range.split("!")[0]
         rows = self.data.get(sheet, [])
         return rows
@@ -17,8 +19,18 @@ class FakeSheets:
         self.data[sheet_name] = []
 
     def write(self, sheet_range: str, values):
-        sheet = sheet_range.split("!")[0]
-        self.data[sheet] = values[1:]  # drop header for simplicity
+        sheet, cell = sheet_range.split("!")
+        rows = self.data.setdefault(sheet, [])
+        start = int(cell[1:]) - 2  # stored rows exclude the header
+        first = max(start, 0)
+        body = values[first - start :]  # a write at A1 starts with the header row
+        end = first + len(body)
+        rows.extend([] for _ in range(end - len(rows)))
+        rows[first:end] = [list(row) for row in body]
+
+    def batch_update(self, data):
+        for item in data:
+            self.write(item["range"], item["values"])
 
 
 @pytest.mark.asyncio
@@ -30,3 +42,99 @@ async def test_upsert_and_list():
     rows = await repo.list_for_run("run_1")
     assert len(rows) == 1
     assert rows[0].step_code == "cash"
+
+
+@pytest.mark.asyncio
+async def test_upsert_updates_existing_row_in_place():
+    sheets = FakeSheets()
+    repo = RunStepsRepository(sheets)  # type: ignore[arg-type]
+    await repo.upsert(
+        [
+            RunStepRecord(run_id="run_1", phase="open", step_code="cash"),
+            RunStepRecord(run_id="run_1", phase="open", step_code="photo"),
+        ]
+    )
+    await repo.upsert([RunStepRecord(run_id="run_1", phase="open", step_code="cash", status="ok")])
+    rows = await repo.list_for_run("run_1")
+    assert [(row.step_code, row.status) for row in rows] == [("cash", "ok"), ("photo", "pending")]
+
+
+@pytest.mark.asyncio
+async def test_list_for_run_groups_rows_from_one_read():
+    sheets = FakeSheets()
+    repo = RunStepsRepository(sheets)  # type: ignore[arg-type]
+    await repo.upsert(
+        [
+            RunStepRecord(run_id="run_1", phase="open", step_code="cash"),
+            RunStepRecord(run_id="run_2", phase="open", step_code="cash"),
+        ]
+    )
+    reads_before = sheets.reads
+
+    first = await repo.list_for_run("run_1")
+    second = await repo.list_for_run("run_2")
+
+    assert [row.run_id for row in first + second] == ["run_1", "run_2"]
+    assert sheets.reads == reads_before + 1
+
+
+@pytest.mark.asyncio
+async def test_list_for_runs_reads_sheet_once():
+    sheets = FakeSheets()
+    repo = RunStepsRepository(sheets)  # type: ignore[arg-type]
+    await repo.upsert(
+        [
+            RunStepRecord(run_id="run_1", phase="open", step_code="cash"),
+            RunStepRecord(run_id="run_2", phase="open", step_code="cash"),
+        ]
+    )
+    reads_before = sheets.reads
+
+    steps = await repo.list_for_runs(["run_1", "run_3"])
+
+    assert [row.run_id for row in steps["run_1"]] == ["run_1"]
+    assert steps["run_3"] == []
+    assert "run_2" not in steps
+    assert sheets.reads == reads_before + 1
+
+
+@pytest.mark.asyncio
+async def test_upsert_appends_new_rows_in_arrival_order():
+    sheets = FakeSheets()
+    repo = RunStepsRepository(sheets)  # type: ignore[arg-type]
+    await repo.upsert([RunStepRecord(run_id="run_1", phase="open", step_code="cash")])
+    await repo.upsert(
+        [
+            RunStepRecord(run_id="run_1", phase="open", step_code="photo"),
+            RunStepRecord(run_id="run_1", phase="open", step_code="keys"),
+            RunStepRecord(run_id="run_1", phase="open", step_code="photo", status="ok"),
+        ]
+    )
+    rows = await repo.list_for_run("run_1")
+    assert [(row.step_code, row.status) for row in rows] == [
+        ("cash", "pending"),
+        ("photo", "ok"),
+        ("keys", "pending"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_read_overlapping_an_upsert_does_not_refill_cache():
+    sheets = FakeSheets()
+    repo = RunStepsRepository(sheets)  # type: ignore[arg-type]
+    await repo.upsert([RunStepRecord(run_id="run_1", phase="open", step_code="cash")])
+    original_read = sheets.read
+
+    def read_racing_an_upsert(sheet_range: str, *, fresh: bool = False):
+        rows = [list(row) for row in original_read(sheet_range, fresh=fresh)]
+        sheets.read = original_read
+        # The upsert lands while this read is still in flight.
+        repo._upsert_sync(  # noqa: SLF001
+            [RunStepRecord(run_id="run_1", phase="open", step_code="cash", status="ok")]
+        )
+        return rows
+
+    sheets.read = read_racing_an_upsert  # type: ignore[method-assign]
+    in_flight = await repo.list_for_run("run_1")
+    assert [row.status for row in in_flight] == ["pending"]
+    assert [row.status for row in await repo.list_for_run("run_1")] == ["ok"]
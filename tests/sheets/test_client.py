@@ -2,6 +2,7 @@ import pathlib
 
 import pytest
 
+from retailcheck.sheets import client as client_module
 from retailcheck.sheets.client import MAX_RETRIES, HttpError, SheetsClient
 
 
@@ -18,6 +19,9 @@ class _DummyService:
     def get(self, **_kwargs):
         return self
 
+    def batchGet(self, **_kwargs):
+        return self
+
     def update(self, **_kwargs):
         return self
 
@@ -27,6 +31,9 @@ class _DummyService:
     def batchUpdate(self, **_kwargs):
         return self
 
+    def batchClear(self, **_kwargs):
+        return self
+
     def execute(self):
         if not self._responses:
             return {}
@@ -37,6 +44,7 @@ class _DummyService:
 
 
 def test_retry_on_broken_pipe(monkeypatch):
+    monkeypatch.setattr(client_module.time, "sleep", lambda _delay: None)
     dummy = _DummyService([BrokenPipeError("boom"), {"values": [["ok"]]}])
     client = SheetsClient("sheet_id", pathlib.Path("/tmp/unused.json"), service=dummy)
     values = client.read("Runs!A1:B2")
@@ -45,18 +53,111 @@ def test_retry_on_broken_pipe(monkeypatch):
     assert stats["io_error"] == 1
 
 
-def _make_http_error():
-    class _FakeResponse:
-        status = 500
+def test_batch_read_returns_values_per_range():
+    dummy = _DummyService([{"valueRanges": [{"values": [["a"]]}, {}]}])
+    client = SheetsClient("sheet_id", pathlib.Path("/tmp/unused.json"), service=dummy)
+    assert client.batch_read(["Templates!A2:F", "TemplateSteps!A2:J"]) == [[["a"]], []]
+
+
+def test_batch_clear_sends_all_ranges_and_drops_cached_reads():
+    class _RecordingService(_DummyService):
+        def __init__(self):
+            super().__init__([{"values": [["old"]]}, {}, {}])
+            self.cleared: list[list[str]] = []
+
+        def batchClear(self, **kwargs):
+            self.cleared.append(kwargs["body"]["ranges"])
+            return self
+
+    service = _RecordingService()
+    client = SheetsClient("sheet_id", pathlib.Path("/tmp/unused.json"), service=service)
+    assert client.read("Templates!A2:F") == [["old"]]
+    client.batch_clear(["Templates", "TemplateSteps"])
+    assert service.cleared == [["Templates", "TemplateSteps"]]
+    assert client.read("Templates!A2:F") == []
+
+
+def test_read_cache_serves_repeats_until_sheet_is_written():
+    dummy = _DummyService([{"values": [["a"]]}, {"values": [["b"]]}, {}, {"values": [["c"]]}])
+    client = SheetsClient("sheet_id", pathlib.Path("/tmp/unused.json"), service=dummy)
+
+    first = client.read("Shops!A2:L")
+    first.append(["mutated"])
+    assert client.read("Shops!A2:L") == [["a"]]
+    assert client.read("Shops!A2:L", fresh=True) == [["b"]]
+
+    client.write("Shops!A5", [["x"]])
+    assert client.read("Shops!A2:L") == [["c"]]
+
+
+def test_read_overlapping_a_write_is_not_cached():
+    class _RacingService(_DummyService):
+        in_flight = None
+
+        def execute(self):
+            hook, self.in_flight = self.in_flight, None
+            if hook is None:
+                return super().execute()
+            hook()  # the write lands while this read is still in flight
+            return {"values": [["old"]]}
+
+    service = _RacingService([{}, {"values": [["new"]]}])
+    client = SheetsClient("sheet_id", pathlib.Path("/tmp/unused.json"), service=service)
+    service.in_flight = lambda: client.write("Runs!A2", [["new"]])
+    assert client.read("Runs!A2:S") == [["old"]]
+    assert client.read("Runs!A2:S") == [["new"]]
+
+
+def test_clients_share_service_and_thread_http(monkeypatch):
+    built: list[str] = []
+    seen_http: list[object] = []
+
+    class _FakeCredentials:
+        @classmethod
+        def from_service_account_file(cls, path, scopes):
+            return cls()
+
+    class _HttpAwareService(_DummyService):
+        def execute(self, http=None):
+            seen_http.append(http)
+            return {"values": []}
+
+    def _fake_build(*_args, **_kwargs):
+        built.append("sheets")
+        return _HttpAwareService([])
+
+    monkeypatch.setattr(client_module, "CredentialsClass", _FakeCredentials)
+    monkeypatch.setattr(client_module, "BuildCallable", _fake_build)
+    monkeypatch.setattr(client_module, "AuthorizedHttpClass", lambda creds, http: object())
+    monkeypatch.setattr(client_module, "HttpClass", lambda timeout: None)
+    client_module._build_service.cache_clear()
+
+    key_file = pathlib.Path("/tmp/shared-key.json")
+    first = SheetsClient("sheet_id", key_file)
+    second = SheetsClient("other_sheet", key_file)
+    first.read("Runs!A1")
+    second.read("Runs!A1")
+
+    client_module._build_service.cache_clear()
+    assert built == ["sheets"]
+    assert seen_http[0] is not None
+    assert seen_http[0] is seen_http[1]
+
+
+def _make_http_error(status: int = 500, headers: dict[str, str] | None = None):
+    class _FakeResponse(dict):
         reason = "boom"
 
         def getheaders(self):
-            return {}
+            return dict(self)
 
-    return HttpError(resp=_FakeResponse(), content=b"boom")
+    resp = _FakeResponse(headers or {})
+    resp.status = status
+    return HttpError(resp=resp, content=b"boom")
 
 
-def test_notifier_called_on_http_failure():
+def test_notifier_called_on_http_failure(monkeypatch):
+    monkeypatch.setattr(client_module.time, "sleep", lambda _delay: None)
     responses = [_make_http_error() for _ in range(MAX_RETRIES)]
     dummy = _DummyService(responses)
     events: list[tuple[str, str]] = []
@@ -72,3 +173,33 @@ def test_notifier_called_on_http_failure():
     assert events[0][0] == "http_error"
     stats = client.get_error_stats()
     assert stats["http_error"] == MAX_RETRIES
+
+
+def test_client_errors_are_not_retried(monkeypatch):
+    monkeypatch.setattr(client_module.time, "sleep", lambda _delay: None)
+    dummy = _DummyService([_make_http_error(404), {"values": [["late"]]}])
+    client = SheetsClient("sheet_id", pathlib.Path("/tmp/unused.json"), service=dummy)
+    with pytest.raises(HttpError):
+        client.read("Missing!A1")
+    assert client.get_error_stats()["http_error"] == 1
+
+
+def test_rate_limit_honours_retry_after(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr(client_module.time, "sleep", sleeps.append)
+    dummy = _DummyService([_make_http_error(429, {"retry-after": "7"}), {"values": [["ok"]]}])
+    client = SheetsClient("sheet_id", pathlib.Path("/tmp/unused.json"), service=dummy)
+    assert client.read("Runs!A1") == [["ok"]]
+    assert sleeps == [7.0]
+
+
+def test_server_errors_back_off_exponentially(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr(client_module.time, "sleep", sleeps.append)
+    # Pin the jitter to its upper bound so the exponential cap is observable.
+    monkeypatch.setattr(client_module.random, "uniform", lambda _low, high: high)
+    dummy = _DummyService([_make_http_error(503) for _ in range(MAX_RETRIES)])
+    client = SheetsClient("sheet_id", pathlib.Path("/tmp/unused.json"), service=dummy)
+    with pytest.raises(HttpError):
+        client.read("Runs!A1")
+    assert sleeps == [client_module.BACKOFF_BASE_SEC * 2**n for n in range(MAX_RETRIES - 1)]
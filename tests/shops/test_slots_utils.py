@@ -1,4 +1,4 @@
-from retailcheck.shops.utils import _parse_slots
+from retailcheck.shops.utils import _parse_slots, _parse_usernames
 
 
 def test_parse_slots_json_dict():
@@ -18,3 +18,7 @@ def test_parse_slots_csv():
     raw = "10:00, 11:30 , "
     slots = _parse_slots(raw)
     assert slots == {"custom": ["10:00", "11:30"]}
+
+
+def test_parse_usernames_strips_at_and_separators():
+    assert _parse_usernames("@anna, @@boris ,,@ viktor\t@") == ["anna", "boris", "viktor"]
@@ -14,6 +14,9 @@ class FakeSheets(SheetsClient):
         sheet_name = sheet_range.split("!")[0]
         return self._data.get(sheet_name, [])
 
+    def batch_read(self, sheet_ranges):
+        return [self.read(sheet_range) for sheet_range in sheet_ranges]
+
     def write(self, *args, **kwargs):
         raise NotImplementedError
 
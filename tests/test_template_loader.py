@@ -1,3 +1,5 @@
+import json
+import os
 from pathlib import Path
 
 from retailcheck.templates.models import load_template_definition
@@ -11,3 +13,17 @@ def test_load_template_definition_opening() -> None:
     assert tmpl.phase == "open"
     assert len(tmpl.steps) == 4
     assert tmpl.steps[0].code == "cash_float_open"
+
+
+def test_load_template_definition_reparses_changed_file(tmp_path: Path) -> None:
+    path = tmp_path / "tmpl.json"
+    payload = json.loads((FIXTURES / "opening_v1.json").read_text(encoding="utf-8"))
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    first = load_template_definition(path)
+    assert load_template_definition(path) is first
+
+    payload["template"]["name"] = "Renamed"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    mtime_ns = path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    assert load_template_definition(path).name == "Renamed"
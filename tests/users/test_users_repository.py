@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+
+from retailcheck.users.repository import UsersRepository
+
+
+class FakeSheets:
+    def __init__(self, rows: list[list[str]]) -> None:
+        self.rows = rows
+        self.reads = 0
+
+    def read(self, sheet_range: str, *, fresh: bool = False):
+        self.reads += 1
+        return [list(row) for row in self.rows]
+
+
+@pytest.mark.asyncio
+async def test_lookups_share_one_snapshot():
+    sheets = FakeSheets(
+        [
+            ["u1", "101", "Anna", "Anna K", "employee", "shop_1, shop_2", "TRUE"],
+            ["u2", "102", "boris", "", "manager", "", "FALSE"],
+        ]
+    )
+    repo = UsersRepository(sheets)  # type: ignore[arg-type]
+
+    by_name = await repo.get_by_username("ANNA")
+    by_tg = await repo.get_by_tg_id(102)
+    active = await repo.list_active()
+
+    assert by_name is not None and by_name.shops == ["shop_1", "shop_2"]
+    assert by_tg is not None and by_tg.user_id == "u2"
+    assert [user.user_id for user in active] == ["u1"]
+    assert await repo.get_by_username("missing") is None
+    assert await repo.get_by_username("@anna") is by_name
+    found = await repo.get_by_usernames(["anna", "boris", "missing"])
+    assert {name: user.user_id for name, user in found.items()} == {"anna": "u1", "boris": "u2"}
+    assert sheets.reads == 1
@@ -8,6 +8,7 @@ Usage:
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import qrcode
@@ -15,6 +16,11 @@ import qrcode
 from retailcheck.config import get_google_config
 from retailcheck.sheets.client import SheetsClient
 
+_ROLES = ("open", "close")
+
+# One encoder per worker process, cleared between payloads; defaults match qrcode.make().
+_QR = qrcode.QRCode()
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Generate QR codes for shop payloads.")
@@ -33,11 +39,17 @@ def parse_args() -> argparse.Namespace:
 
 def load_shops(client: SheetsClient) -> list[tuple[str, str]]:
     rows = client.read("Shops!A2:B")
-    shops = []
-    for row in rows:
-        if row and row[0]:
-            shops.append((row[0], row[1] if len(row) > 1 else row[0]))
-    return shops
+    return [(row[0], row[1] if len(row) > 1 else row[0]) for row in rows if row and row[0]]
+
+
+def _render(task: tuple[str, Path]) -> Path:
+    payload, file_path = task
+    _QR.clear()
+    _QR.version = None  # clear() keeps the last fitted size; refit per payload
+    _QR.add_data(payload)
+    _QR.make(fit=True)
+    _QR.make_image().save(str(file_path))
+    return file_path
 
 
 def main() -> None:
@@ -47,13 +59,18 @@ def main() -> None:
     shops = load_shops(client)
     output_dir = Path(args.output)
     output_dir.mkdir(parents=True, exist_ok=True)
+    labels = []
+    tasks = []
+    link_prefix = f"https://t.me/{args.bot_username}?start="
     for shop_id, name in shops:
-        for role in ("open", "close"):
-            payload = f"https://t.me/{args.bot_username}?start={shop_id}__{role}"
-            img = qrcode.make(payload)
-            file_path = output_dir / f"{shop_id}_{role}.png"
-            img.save(str(file_path))
-            print(f"[OK] {name} ({shop_id}) {role} → {file_path}")
+        for role in _ROLES:
+            payload = f"{link_prefix}{shop_id}__{role}"
+            labels.append(f"{name} ({shop_id}) {role}")
+            tasks.append((payload, output_dir / f"{shop_id}_{role}.png"))
+    # PNG encoding is CPU-bound and every code is independent, so spread it over cores.
+    with ProcessPoolExecutor() as pool:
+        for label, file_path in zip(labels, pool.map(_render, tasks, chunksize=16), strict=True):
+            print(f"[OK] {label} → {file_path}")
 
 
 if __name__ == "__main__":
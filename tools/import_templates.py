@@ -27,6 +27,7 @@ TEMPLATE_STEPS_HEADER = [
     "hint",
     "owner_role",
 ]
+_VALID_PHASES = frozenset({"open", "close", "continue"})
 
 
 def parse_args() -> argparse.Namespace:
@@ -41,31 +42,33 @@ def parse_args() -> argparse.Namespace:
 
 def write_templates(client: SheetsClient, templates: list[TemplateDefinition]) -> None:
     _validate_templates(templates)
-    rows = [TEMPLATES_HEADER]
-    for tmpl in templates:
-        rows.append(tmpl.template_row())
-    client.clear("Templates")
-    client.write("Templates!A1", rows)
-
-    step_rows = [TEMPLATE_STEPS_HEADER]
-    for tmpl in templates:
-        step_rows.extend(step.to_row(tmpl.template_id) for step in tmpl.steps)
-    client.clear("TemplateSteps")
-    client.write("TemplateSteps!A1", step_rows)
+    rows = [TEMPLATES_HEADER, *(tmpl.template_row() for tmpl in templates)]
+    step_rows = [
+        TEMPLATE_STEPS_HEADER,
+        *(step.to_row(tmpl.template_id) for tmpl in templates for step in tmpl.steps),
+    ]
+    client.batch_clear(["Templates", "TemplateSteps"])
+    client.batch_update(
+        [
+            {"range": "Templates!A1", "values": rows},
+            {"range": "TemplateSteps!A1", "values": step_rows},
+        ]
+    )
 
 
 def _validate_templates(templates: list[TemplateDefinition]) -> None:
-    phases = {"open", "close", "continue"}
     seen_ids: set[str] = set()
+    phases_seen: set[str] = set()
     for tmpl in templates:
         if tmpl.template_id in seen_ids:
             raise ValueError(f"Duplicate template_id detected: {tmpl.template_id}")
         seen_ids.add(tmpl.template_id)
-        if tmpl.phase not in phases:
+        if tmpl.phase not in _VALID_PHASES:
             raise ValueError(f"Template {tmpl.template_id} has invalid phase {tmpl.phase}")
-    if "open" not in {tmpl.phase for tmpl in templates}:
+        phases_seen.add(tmpl.phase)
+    if "open" not in phases_seen:
         raise ValueError("At least one template with phase='open' is required")
-    if "close" not in {tmpl.phase for tmpl in templates}:
+    if "close" not in phases_seen:
         raise ValueError("At least one template with phase='close' is required")
 
 
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Sequence
+from operator import itemgetter
 
 from redis.asyncio import Redis
 
@@ -16,18 +17,26 @@ from retailcheck.config import load_app_config
 
 
 async def fetch_locks(redis: Redis) -> Sequence[tuple[str, int]]:
-    keys = await redis.keys("lock:run:*")
-    result = []
+    # SCAN instead of KEYS so a large keyspace doesn't block Redis. SCAN may return
+    # a key more than once, so dedupe before querying TTLs.
+    scanned = [key async for key in redis.scan_iter(match="lock:run:*", count=1000)]
+    keys = list(dict.fromkeys(scanned))
+    if not keys:
+        return []
+    # One round-trip for all TTLs instead of one per key.
+    pipe = redis.pipeline(transaction=False)
     for key in keys:
-        ttl = await redis.pttl(key)
-        name = key.decode() if isinstance(key, bytes) else key
-        result.append((name, ttl))
-    return sorted(result)
+        pipe.pttl(key)
+    ttls = await pipe.execute()
+    # main() asks for decoded responses, but other callers may pass a bytes client.
+    names = [key.decode() if isinstance(key, bytes) else key for key in keys]
+    # Names are unique after the dedupe above, so ordering by name alone is enough.
+    return sorted(zip(names, ttls, strict=True), key=itemgetter(0))
 
 
 async def main() -> None:
     config = load_app_config()
-    redis = Redis.from_url(config.redis.url)
+    redis = Redis.from_url(config.redis.url, decode_responses=True)
     try:
         locks = await fetch_locks(redis)
     finally:
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import Counter
+from statistics import fmean
 
 from retailcheck.config import load_app_config
 from retailcheck.runs.repository import RunsRepository
@@ -26,8 +27,15 @@ async def main() -> None:
     runsteps_repo = RunStepsRepository(sheets)
 
     runs = await runs_repo.list_runs()
-    statuses = Counter(run.status for run in runs)
-    closer_assigned = len([run for run in runs if run.closer_user_id])
+    statuses: Counter[str] = Counter()
+    closer_assigned = 0
+    for run in runs:
+        statuses[run.status] += 1
+        closer_assigned += bool(run.closer_user_id)
+    # Runs without a stored delta fall back to their steps; fetch those in one go.
+    steps_by_run = await runsteps_repo.list_for_runs(
+        run.run_id for run in runs if not run.delta_rub
+    )
     delta_values = []
     for run in runs:
         if run.delta_rub:
@@ -36,22 +44,22 @@ async def main() -> None:
             except ValueError:
                 continue
         else:
-            steps = await runsteps_repo.list_for_run(run.run_id)
+            steps = steps_by_run[run.run_id]
             total = sum(float(step.delta_number) for step in steps if step.delta_number)
             if total:
                 delta_values.append(total)
 
-    print("=== RetailCheck Metrics ===")
-    print("Всего смен:", len(runs))
-    for status, count in statuses.items():
-        print(f"- {status}: {count}")
+    lines = ["=== RetailCheck Metrics ===", f"Всего смен: {len(runs)}"]
+    lines.extend(f"- {status}: {count}" for status, count in statuses.items())
     if runs:
-        print(f"Коэффициент закрытия (closer назначен): {closer_assigned / len(runs):.2%}")
+        lines.append(f"Коэффициент закрытия (closer назначен): {closer_assigned / len(runs):.2%}")
     if delta_values:
-        avg_delta = sum(delta_values) / len(delta_values)
-        print(f"Средняя дельта: {avg_delta:+.2f} ₽")
+        avg_delta = fmean(delta_values)
+        lines.append(f"Средняя дельта: {avg_delta:+.2f} ₽")
         max_delta = max(delta_values, key=abs)
-        print(f"Максимальная дельта по модулю: {max_delta:+.2f} ₽")
+        lines.append(f"Максимальная дельта по модулю: {max_delta:+.2f} ₽")
+    # One write keeps the report in one piece next to async log output.
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
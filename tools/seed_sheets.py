@@ -34,15 +34,7 @@ def load_csv(path: Path) -> list[list[str]]:
     if not path.exists():
         raise FileNotFoundError(f"CSV file not found: {path}")
     with path.open("r", encoding="utf-8", newline="") as fp:
-        reader = csv.reader(fp)
-        return [row for row in reader]
-
-
-def seed_sheet(client: SheetsClient, sheet_name: str, values: list[list[str]]) -> None:
-    if not values:
-        raise ValueError(f"No values to write for sheet {sheet_name}")
-    client.clear(sheet_name)
-    client.write(f"{sheet_name}!A1", values)
+        return list(csv.reader(fp))
 
 
 def parse_args() -> argparse.Namespace:
@@ -60,11 +52,24 @@ def main() -> None:
     args = parse_args()
     google_cfg = get_google_config()
     client = SheetsClient(google_cfg.sheets_id, google_cfg.service_account_json)
-    for sheet_name, filename in SHEET_TO_FILE.items():
-        csv_path = args.data_dir / filename
-        values = load_csv(csv_path)
-        seed_sheet(client, sheet_name, values)
-        print(f"[OK] Seeded {sheet_name} from {csv_path}")
+    # Load and check every CSV before touching the spreadsheet, so a missing or
+    # empty file aborts the run with all sheets still intact.
+    loaded = [
+        (sheet_name, args.data_dir / filename, load_csv(args.data_dir / filename))
+        for sheet_name, filename in SHEET_TO_FILE.items()
+    ]
+    for sheet_name, _csv_path, values in loaded:
+        if not values:
+            raise ValueError(f"No values to write for sheet {sheet_name}")
+    client.batch_clear([sheet_name for sheet_name, _csv_path, _values in loaded])
+    client.batch_update(
+        [
+            {"range": f"{sheet_name}!A1", "values": values}
+            for sheet_name, _csv_path, values in loaded
+        ]
+    )
+    lines = [f"[OK] Seeded {sheet_name} from {csv_path}" for sheet_name, csv_path, _ in loaded]
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":